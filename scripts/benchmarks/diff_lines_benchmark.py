@@ -0,0 +1,51 @@
+# Micro-benchmark of diffLines (v3.0/object_utilities.py) against the previous quadratic version.
+# Run from Blender so the add-on module can be imported:
+#   blender -b --factory-startup --python scripts/benchmarks/diff_lines_benchmark.py
+
+import os
+import sys
+import copy
+import random
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "v3.0"))
+
+import object_utilities
+
+# -----------------------------------------------------------------------------
+
+def legacyDiffLines(report, sourceName, targetName, lines1, lines2):
+    temp = copy.deepcopy(lines1)
+
+    for x in temp:
+        if x in lines2:
+            lines1.remove(x)
+            lines2.remove(x)
+
+    object_utilities.diffLines(report, sourceName, targetName, lines1, lines2)
+
+# -----------------------------------------------------------------------------
+
+def makeLines(count, unique_ratio=0.01):
+    rng = random.Random(count)
+    common = ["bone_" + str(i) + ":constraint_" + str(rng.randint(0, 9)) for i in range(count)]
+    unique = max(1, int(count * unique_ratio))
+    lines1 = sorted(common + ["source_only_" + str(i) for i in range(unique)])
+    lines2 = sorted(common + ["target_only_" + str(i) for i in range(unique)])
+    return lines1, lines2
+
+# -----------------------------------------------------------------------------
+
+def bench(function, lines1, lines2, repeat):
+    def run():
+        function(object_utilities.DiffReport(), "Source", "Target", list(lines1), list(lines2))
+    return min(timeit.repeat(run, number=1, repeat=repeat))
+
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    for count in (10_000, 100_000):
+        lines1, lines2 = makeLines(count)
+        new_time = bench(object_utilities.diffLines, lines1, lines2, 5)
+        old_time = bench(legacyDiffLines, lines1, lines2, 1)
+        print(f"{count:>7} lines: legacy {old_time:8.3f}s  counter {new_time:8.3f}s  speedup x{old_time / new_time:.0f}")
@@ -26,57 +26,196 @@ bl_info = {
 }
 
 import bpy
+import fnmatch
 import mathutils
+import numpy as np
 from bpy.types import Operator
 from bpy.props import StringProperty
+from bpy_extras.io_utils import ExportHelper, ImportHelper
 
 # -------------------------------------------------------------------------------------------------
+# Constraint stack signatures: type, name and every editable RNA property value of each
+# constraint, with pointers to the armature itself written as "<self>" so that retargeted
+# stacks compare equal. The add-ons are installed separately and cannot import each other,
+# so this is a copy of the rig fingerprint serialization of object_utilities: keep them in sync
+
+_signature_skip_props = {'rna_type', 'name', 'show_expanded', 'active', 'is_valid', 'is_override_data_editable'}
+_rna_schema_cache = {}
+
+def getRnaSchema(struct):
+    key = struct.bl_rna.identifier
+    schema = _rna_schema_cache.get(key)
+
+    if schema is None:
+        schema = tuple(
+            (prop.identifier, prop.type) for prop in struct.bl_rna.properties
+            if prop.identifier not in _signature_skip_props and (prop.type == 'COLLECTION' or not prop.is_readonly)
+        )
+        _rna_schema_cache[key] = schema
+
+    return schema
+
+def serializeRnaValue(value, prop_type, owner):
+    if prop_type == 'POINTER':
+        if value is None:
+            return None
+        if value == owner:
+            return "<self>"
+        if isinstance(value, bpy.types.ID):
+            return value.name
+        return None
+    if prop_type == 'COLLECTION':
+        return tuple(serializeRnaStruct(item, owner) for item in value)
+    if isinstance(value, float):
+        return round(value, 6)
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(value))
+    try:
+        return tuple(serializeRnaValue(v, prop_type, owner) for v in value)
+    except TypeError:
+        return str(value)
+
+def serializeRnaStruct(struct, owner):
+    values = []
+    for identifier, prop_type in getRnaSchema(struct):
+        try:
+            values.append((identifier, serializeRnaValue(getattr(struct, identifier), prop_type, owner)))
+        except:
+            pass
+    return tuple(values)
+
+def getConstraintStackSignature(bone, owner):
+    return tuple((constraint.type, constraint.name, serializeRnaStruct(constraint, owner)) for constraint in bone.constraints)
+
+# Source side of a constraint copy, read once for any number of targets:
+# {bone name: (stack signature, constraints)}
+
+def getConstraintStacks(armature):
+    return {bone.name: (getConstraintStackSignature(bone, armature), list(bone.constraints)) for bone in armature.pose.bones}
+
+def retargetConstraint(constraint, source, target):
+    for identifier in ("target", "pole_target"):
+        if getattr(constraint, identifier, None) == source:
+            setattr(constraint, identifier, target)
+
+    for constraint_target in getattr(constraint, "targets", ()):
+        if constraint_target.target == source:
+            constraint_target.target = target
+
+# When both stacks hold the same constraints in the same order, only the differing properties
+# are written. Returns False when the stack has to be rebuilt instead
+
+def updateConstraintStack(source, target, source_constraints, signature, target_bone, target_signature):
+    if len(signature) != len(target_signature):
+        return False
+    for (constraint_type, name, _), (target_type, target_name, _) in zip(signature, target_signature):
+        if constraint_type != target_type or name != target_name:
+            return False
+
+    for source_constraint, target_constraint, (_, _, props), (_, _, target_props) in zip(source_constraints, target_bone.constraints, signature, target_signature):
+        if props == target_props:
+            continue
+        schema = dict(getRnaSchema(source_constraint))
+        for (identifier, value), (_, target_value) in zip(props, target_props):
+            if value == target_value:
+                continue
+            if schema[identifier] == 'COLLECTION':
+                return False
+            new_value = getattr(source_constraint, identifier)
+            if new_value == source:
+                new_value = target
+            try:
+                setattr(target_constraint, identifier, new_value)
+            except (AttributeError, TypeError, ValueError):
+                return False
+
+    return True
+
+# Applies the source stacks from getConstraintStacks to a target armature
+# Returns {"replaced", "updated", "matching", "missing"} bone counts
+
+def copyConstraintStacks(source, target, stacks):
+    target_bones = {bone.name: bone for bone in target.pose.bones}
+    counts = {"replaced": 0, "updated": 0, "matching": 0, "missing": 0}
+
+    for bone_name, (signature, source_constraints) in stacks.items():
+        target_bone = target_bones.get(bone_name)
+        if target_bone is None:
+            counts["missing"] += 1
+            continue
 
-def copyArmatureConstraints(self, context):
-    target = context.selected_objects[0]
+        target_signature = getConstraintStackSignature(target_bone, target)
+        if target_signature == signature:
+            counts["matching"] += 1
+            continue
 
-    if target is None:
-        return {'CANCELLED'}
+        if updateConstraintStack(source, target, source_constraints, signature, target_bone, target_signature):
+            counts["updated"] += 1
+            continue
+
+        constraints = target_bone.constraints
+        for constraint in reversed(list(constraints)):
+            constraints.remove(constraint)
+
+        for constraint in source_constraints:
+            retargetConstraint(constraints.copy(constraint), source, target)
+
+        counts["replaced"] += 1
+
+    return counts
 
-    # get active object
+def formatConstraintCounts(counts):
+    return str(counts["replaced"]) + " bone(s) replaced, " + str(counts["updated"]) + " updated, " + str(counts["matching"]) + " already matching, " + str(counts["missing"]) + " missing"
+
+# -------------------------------------------------------------------------------------------------
+
+def getConstraintCopySource(self, context):
     source = context.active_object
 
-    if source is None:
-        return {'CANCELLED'}
+    if source is None or source.type != 'ARMATURE':
+        self.report({'WARNING'}, "Active object must be an armature")
+        return None, []
+
+    targets = [obj for obj in context.selected_objects if obj != source and obj.type == 'ARMATURE']
+
+    if not targets:
+        self.report({'WARNING'}, "Select a target armature")
 
-    if target == source:
-        target = context.selected_objects[1]
+    return source, targets
 
-    if target is None:
+def copyArmatureConstraints(self, context):
+    source, targets = getConstraintCopySource(self, context)
+
+    if not targets:
         return {'CANCELLED'}
 
-    target.select_set(False)
-    source.select_set(True)
+    target = targets[0]
+    counts = copyConstraintStacks(source, target, getConstraintStacks(source))
+
+    self.report({'INFO'}, "Copied " + source.name + " bone constraints to " + target.name + ": " + formatConstraintCounts(counts))
 
-    bpy.ops.object.posemode_toggle()
-    bpy.ops.pose.select_all(action='SELECT')
-    sourceBones = context.selected_pose_bones
-    bpy.ops.pose.select_all(action='DESELECT')
-    bpy.ops.object.posemode_toggle()
+    return {'FINISHED'}
 
-    for bone in sourceBones:
+# -------------------------------------------------------------------------------------------------
 
-        bone1 = source.pose.bones[bone.name]
-        bone2 = target.pose.bones[bone.name]
+def copyArmatureConstraintsToSelected(self, context):
+    source, targets = getConstraintCopySource(self, context)
 
-        if bone2 is not None:
-            for constraint in bone2.constraints:
-                bone2.constraints.remove(constraint)
+    if not targets:
+        return {'CANCELLED'}
 
-            for constraint in bone1.constraints:
-                bone2.constraints.copy(constraint)
+    stacks = getConstraintStacks(source)
+    changed_targets = 0
 
-            for constraint in bone2.constraints:
-                if hasattr(constraint, 'target'):
-                    if constraint.target == source:
-                        constraint.target = target
+    for target in targets:
+        counts = copyConstraintStacks(source, target, stacks)
+        self.report({'INFO'}, target.name + ": " + formatConstraintCounts(counts))
+        if counts["replaced"] > 0 or counts["updated"] > 0:
+            changed_targets += 1
 
-    self.report({'INFO'}, "Copied " + source.name + " bone constraints to " + target.name)
+    self.report({'INFO'}, "Copied " + source.name + " bone constraints to " + str(len(targets)) + " armature(s), " + str(changed_targets) + " changed")
 
     return {'FINISHED'}
 
@@ -93,6 +232,16 @@ class OBJECT_OT_CopyArmatureConstraints(bpy.types.Operator):
     def execute(self, context):
         return copyArmatureConstraints(self, context)
 
+class OBJECT_OT_CopyArmatureConstraintsToSelected(bpy.types.Operator):
+    """Copy Armature Constraints To Selected"""
+    bl_idname = "object.copy_armature_constraints_to_selected"
+    bl_label = "Copy armature constraints to selected"
+    bl_description = "Copies the bone constraints of the active armature to every selected armature, only changing the bones that differ"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        return copyArmatureConstraintsToSelected(self, context)
+
 # -------------------------------------------------------------------------------------------------
 # Save start pose and delta pose
 start_pose = {}
@@ -113,6 +262,112 @@ def getSelectedArmature(context):
 
     return None
 
+# -------------------------------------------------------------------------------------------------
+# Retargeting: maps copied bone names to the bones of another armature
+# Exact names and the user mapping text come first, then names normalized for namespaces
+# (mixamorig:), rig prefixes (DEF-) and side markers. Sides are found with the rules of
+# getMirroredName in object_utilities (.R/.r/Right/right then .L/.l/Left/left, the dotted
+# markers anywhere in the name, the words as prefixes), then with _R/_L suffixes
+
+_bone_name_prefixes = ("DEF-", "ORG-", "MCH-")
+
+# (marker, side, prefix only), in getMirroredName order
+_bone_side_markers = (
+    (".R", ".R", False),
+    (".r", ".R", False),
+    ("Right", ".R", True),
+    ("right", ".R", True),
+    (".L", ".L", False),
+    (".l", ".L", False),
+    ("Left", ".L", True),
+    ("left", ".L", True),
+)
+_bone_name_index_cache = {}
+
+def normalizeBoneName(name):
+    name = name.rsplit(":", 1)[-1]
+
+    for prefix in _bone_name_prefixes:
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+            break
+
+    side = ""
+    for marker, marker_side, is_prefix in _bone_side_markers:
+        if name.startswith(marker) if is_prefix else marker in name:
+            name = name.replace(marker, "")
+            side = marker_side
+            break
+    else:
+        for suffix, suffix_side in (("_R", ".R"), ("_r", ".R"), ("_L", ".L"), ("_l", ".L")):
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+                side = suffix_side
+                break
+
+    return name.strip("_.- ").lower() + side
+
+def getBoneNameMapping(text):
+    mapping = {}
+    if text is None:
+        return mapping
+
+    for line in text.as_string().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        source, target = line.split("=", 1)
+        mapping[source.strip()] = target.strip()
+
+    return mapping
+
+def buildBoneNameIndex(source_names, target_names, mapping):
+    index = {}
+    target_set = set(target_names)
+
+    for name in source_names:
+        if mapping.get(name) in target_set:
+            index[name] = mapping[name]
+        elif name in target_set:
+            index[name] = name
+
+    used = set(index.values())
+    normalized_targets = {}
+    for name in target_names:
+        if name not in used:
+            normalized_targets.setdefault(normalizeBoneName(name), name)
+
+    for name in source_names:
+        if name in index:
+            continue
+        match = normalized_targets.pop(normalizeBoneName(name), None)
+        if match is not None:
+            index[name] = match
+
+    return index
+
+# Returns {copied bone name: armature bone name}, cached per armature data until its bone names,
+# the copied names or the mapping text change. Reading the bone names is cheap next to the
+# normalization of every name, and catches renames that keep the bone count
+
+def getBoneNameIndex(context, armature, source_names):
+    text = context.scene.bone_name_mapping
+    bone_names = tuple(bone.name for bone in armature.data.bones)
+    source_names = tuple(source_names)
+    mapping_key = text.as_string() if text is not None else ""
+
+    key = armature.data.as_pointer()
+    cached = _bone_name_index_cache.get(key)
+    if cached is not None and cached[0] == bone_names and cached[1] == source_names and cached[2] == mapping_key:
+        return cached[3]
+
+    index = buildBoneNameIndex(source_names, bone_names, getBoneNameMapping(text))
+    _bone_name_index_cache[key] = (bone_names, source_names, mapping_key, index)
+    return index
+
+def getIndexedPoseBone(armature, bone_name_index, name):
+    return armature.pose.bones.get(bone_name_index.get(name, ""))
+
 # -------------------------------------------------------------------------------------------------
 
 def copyBonePositionsRotations(self, context):
@@ -160,6 +415,149 @@ def clearArmatureActionKeys(armature):
 
 # -------------------------------------------------------------------------------------------------
 
+# Local transform channels of a pose bone, as (name, offset, size) in a row of sampled values
+
+_channel_layout = (
+    ("location", 0, 3),
+    ("rotation_quaternion", 3, 4),
+    ("rotation_euler", 7, 3),
+    ("rotation_axis_angle", 10, 4),
+    ("scale", 14, 3),
+)
+_channel_count = 17
+_channel_offsets = {channel: (offset, size) for channel, offset, size in _channel_layout}
+
+def getBoneChannelPaths(bone_names, channels=None):
+    paths = {}
+    for index, name in enumerate(bone_names):
+        for channel, offset, size in _channel_layout:
+            if channels is None or channel in channels:
+                paths[f'pose.bones["{name}"].{channel}'] = (index, offset, size)
+    return paths
+
+# -------------------------------------------------------------------------------------------------
+# Animation copy/paste filters, read from the scene settings shown in the armature panel
+
+_channel_groups = (
+    ("location", ("location",)),
+    ("rotation", ("rotation_quaternion", "rotation_euler", "rotation_axis_angle")),
+    ("scale", ("scale",)),
+)
+
+def getFilteredChannels(scene):
+    channels = []
+    for group, group_channels in _channel_groups:
+        if getattr(scene, "bone_animation_use_" + group):
+            channels.extend(group_channels)
+    return tuple(channels)
+
+def getFilteredBones(scene, armature):
+    return [bone for bone in armature.pose.bones if not scene.bone_animation_only_selected or bone.bone.select]
+
+def getFilteredFrameRange(scene):
+    if not scene.bone_animation_use_frame_range:
+        return None
+    return (scene.bone_animation_frame_start, scene.bone_animation_frame_end)
+
+def isBoneAnimationFiltered(scene):
+    if scene.bone_animation_only_selected or scene.bone_animation_use_frame_range:
+        return True
+    return not all(getattr(scene, "bone_animation_use_" + group) for group, _ in _channel_groups)
+
+# -------------------------------------------------------------------------------------------------
+# Returns a (bones, channels) array of the current local transforms
+
+def readPoseChannels(armature):
+    bones = armature.pose.bones
+    values = np.empty((len(bones), _channel_count), dtype=np.float32)
+
+    for channel, offset, size in _channel_layout:
+        buffer = np.empty(len(bones) * size, dtype=np.float32)
+        bones.foreach_get(channel, buffer)
+        values[:, offset:offset + size] = buffer.reshape(-1, size)
+
+    return values
+
+def writePoseChannels(armature, values):
+    bones = armature.pose.bones
+
+    for channel, offset, size in _channel_layout:
+        bones.foreach_set(channel, np.ascontiguousarray(values[:, offset:offset + size], dtype=np.float32).ravel())
+
+# -------------------------------------------------------------------------------------------------
+# Local channels only come from the action fcurves unless drivers or NLA are involved
+# (constraints do not change them), in which case the scene has to be evaluated
+
+def canSampleFcurvesDirectly(armature):
+    anim = armature.animation_data
+
+    if anim.use_tweak_mode or anim.action_influence < 1.0 or anim.action_blend_type != 'REPLACE':
+        return False
+
+    for track in anim.nla_tracks:
+        if not track.mute and len(track.strips) > 0:
+            return False
+
+    for driver in anim.drivers:
+        if driver.data_path.startswith('pose.bones["'):
+            return False
+
+    return True
+
+# -------------------------------------------------------------------------------------------------
+
+def evaluateFcurve(fcurve, frames):
+    count = len(fcurve.keyframe_points)
+
+    # Curves keyed on every sampled frame are read in bulk
+    if count == len(frames) and len(fcurve.modifiers) == 0:
+        co = np.empty(count * 2, dtype=np.float64)
+        fcurve.keyframe_points.foreach_get("co", co)
+        co = co.reshape(-1, 2)
+        if np.array_equal(co[:, 0], frames):
+            return co[:, 1]
+
+    return [fcurve.evaluate(frame) for frame in frames]
+
+# -------------------------------------------------------------------------------------------------
+# Returns a (frames, bones, channels) array sampled from the action fcurves, without frame changes
+
+def sampleBoneAnimationFromFcurves(armature, action, frames, bone_indices, channels):
+    bone_names = [armature.pose.bones[index].name for index in bone_indices]
+    paths = getBoneChannelPaths(bone_names, channels)
+    frames = np.asarray(frames, dtype=np.float64)
+
+    values = np.repeat(readPoseChannels(armature)[bone_indices][np.newaxis], len(frames), axis=0)
+
+    for fcurve in action.fcurves:
+        target = paths.get(fcurve.data_path)
+        if target is None or fcurve.mute:
+            continue
+        index, offset, size = target
+        if fcurve.array_index >= size:
+            continue
+        values[:, index, offset + fcurve.array_index] = evaluateFcurve(fcurve, frames)
+
+    return values
+
+# -------------------------------------------------------------------------------------------------
+
+def sampleBoneAnimationFromScene(scene, armature, frames, bone_indices):
+    values = np.empty((len(frames), len(bone_indices), _channel_count), dtype=np.float32)
+    original_frame = scene.frame_current
+    original_subframe = scene.frame_subframe
+
+    try:
+        for index, frame in enumerate(frames):
+            setSceneFrame(scene, frame)
+            values[index] = readPoseChannels(armature)[bone_indices]
+    finally:
+        scene.frame_set(original_frame, subframe=original_subframe)
+
+    return values
+
+# -------------------------------------------------------------------------------------------------
+
 def copyBoneAnimationAllFrames(self, context):
     global copied_bone_animation
 
@@ -172,45 +570,50 @@ def copyBoneAnimationAllFrames(self, context):
         self.report({'WARNING'}, "Selected armature has no action")
         return {'CANCELLED'}
 
+    scene = context.scene
     action = armature.animation_data.action
+    bones = getFilteredBones(scene, armature)
+    channels = getFilteredChannels(scene)
+
+    if not bones or not channels:
+        self.report({'WARNING'}, "No bone or channel left by the filters")
+        return {'CANCELLED'}
+
+    # Only the curves of the filtered bones and channels give keyed frames
+    paths = getBoneChannelPaths([bone.name for bone in bones], channels)
     frames = set()
 
     for fcurve in action.fcurves:
-        if fcurve.data_path.startswith('pose.bones["'):
-            for key in fcurve.keyframe_points:
-                frames.add(float(key.co.x))
+        if fcurve.data_path in paths:
+            co = np.empty(len(fcurve.keyframe_points) * 2, dtype=np.float64)
+            fcurve.keyframe_points.foreach_get("co", co)
+            frames.update(co[0::2].tolist())
+
+    frame_range = getFilteredFrameRange(scene)
+    if frame_range is not None:
+        frames = {frame for frame in frames if frame_range[0] <= frame <= frame_range[1]}
 
     if not frames:
         self.report({'WARNING'}, "No keyed pose frames found")
         return {'CANCELLED'}
 
-    scene = context.scene
-    original_frame = scene.frame_current
-    original_subframe = scene.frame_subframe
     sorted_frames = sorted(frames)
+    bone_indices = [armature.pose.bones.find(bone.name) for bone in bones]
 
-    copied_bone_animation = {"frames": sorted_frames, "bones_by_frame": {}}
-
-    try:
-        for frame in sorted_frames:
-            setSceneFrame(scene, frame)
-            frame_data = {}
-
-            for bone in armature.pose.bones:
-                frame_data[bone.name] = {
-                    "location": bone.location.copy(),
-                    "rotation_mode": bone.rotation_mode,
-                    "rotation_quaternion": bone.rotation_quaternion.copy(),
-                    "rotation_euler": bone.rotation_euler.copy(),
-                    "rotation_axis_angle": tuple(bone.rotation_axis_angle),
-                    "scale": bone.scale.copy(),
-                }
+    if canSampleFcurvesDirectly(armature):
+        values = sampleBoneAnimationFromFcurves(armature, action, sorted_frames, bone_indices, channels)
+    else:
+        values = sampleBoneAnimationFromScene(scene, armature, sorted_frames, bone_indices)
 
-            copied_bone_animation["bones_by_frame"][frame] = frame_data
-    finally:
-        scene.frame_set(original_frame, subframe=original_subframe)
+    copied_bone_animation = {
+        "frames": sorted_frames,
+        "bone_names": [bone.name for bone in bones],
+        "rotation_modes": [bone.rotation_mode for bone in bones],
+        "channels": channels,
+        "values": values,
+    }
 
-    self.report({'INFO'}, "Copied " + str(len(sorted_frames)) + " keyed frame(s) with loc/rot/scale")
+    self.report({'INFO'}, "Copied " + str(len(sorted_frames)) + " keyed frame(s) of " + str(len(bones)) + " bone(s)")
     return {'FINISHED'}
 
 # -------------------------------------------------------------------------------------------------
@@ -229,11 +632,14 @@ def pasteBonePositionsRotations(self, context):
     inserted_keys_count = 0
     use_auto_key = context.scene.tool_settings.use_keyframe_insert_auto
 
-    for bone in armature.pose.bones:
-        if bone.name not in copied_bone_transforms:
+    bone_name_index = getBoneNameIndex(context, armature, copied_bone_transforms.keys())
+
+    for source_name in list(bone_name_index):
+        bone = getIndexedPoseBone(armature, bone_name_index, source_name)
+        if bone is None:
             continue
 
-        data = copied_bone_transforms[bone.name]
+        data = copied_bone_transforms[source_name]
         bone.location = data['location']
         bone.rotation_mode = data['rotation_mode']
 
@@ -266,6 +672,200 @@ def pasteBonePositionsRotations(self, context):
 
 # -------------------------------------------------------------------------------------------------
 
+def getRotationChannel(rotation_mode):
+    if rotation_mode == 'QUATERNION':
+        return "rotation_quaternion"
+    if rotation_mode == 'AXIS_ANGLE':
+        return "rotation_axis_angle"
+    return "rotation_euler"
+
+def getKeyframeEnumValue(identifier, item):
+    return bpy.types.Keyframe.bl_rna.properties[identifier].enum_items[item].value
+
+# -------------------------------------------------------------------------------------------------
+def readFcurveKeys(fcurve):
+    co = np.empty(len(fcurve.keyframe_points) * 2, dtype=np.float64)
+    fcurve.keyframe_points.foreach_get("co", co)
+    return co.reshape(-1, 2)
+
+# Writes one fcurve per array index in bulk, replacing existing curves of the same path
+# channel_values is a (frames, size) array. With a frame_range (start, end), existing curves
+# are kept and only their keys within the range are replaced
+
+def writeChannelKeys(action, data_path, group, frames, channel_values, interpolation, handle_type, key_mask=None, frame_range=None):
+    frames = np.asarray(frames, dtype=np.float32)
+    written = 0
+
+    # Replaced curves may keep the curve count, so the fcurve index is dropped explicitly
+    _fcurve_index_cache.pop(action.as_pointer(), None)
+
+    for index in range(channel_values.shape[1]):
+        fcurve = action.fcurves.find(data_path, index=index)
+        if fcurve is not None and frame_range is None:
+            action.fcurves.remove(fcurve)
+            fcurve = None
+
+        if key_mask is None:
+            key_frames = frames
+            key_values = channel_values[:, index]
+        else:
+            key_frames = frames[key_mask[:, index]]
+            key_values = channel_values[key_mask[:, index], index]
+
+        count = len(key_frames)
+
+        if fcurve is None:
+            if count == 0:
+                continue
+            fcurve = action.fcurves.new(data_path, index=index, action_group=group)
+        else:
+            # Keys in the range go, the others stay as they are
+            points = fcurve.keyframe_points
+            co = readFcurveKeys(fcurve)
+            in_range = np.flatnonzero((co[:, 0] >= frame_range[0]) & (co[:, 0] <= frame_range[1]))
+            for key_index in in_range[::-1]:
+                points.remove(points[int(key_index)], fast=True)
+
+        points = fcurve.keyframe_points
+        existing = len(points)
+        points.add(count)
+        total = existing + count
+
+        co = np.empty(total * 2, dtype=np.float32)
+        points.foreach_get("co", co)
+        co = co.reshape(-1, 2)
+        co[existing:, 0] = key_frames
+        co[existing:, 1] = key_values
+        points.foreach_set("co", co.ravel())
+
+        for prop, value in (("interpolation", interpolation), ("handle_left_type", handle_type), ("handle_right_type", handle_type)):
+            items = np.empty(total, dtype=np.int32)
+            points.foreach_get(prop, items)
+            items[existing:] = value
+            points.foreach_set(prop, items)
+
+        fcurve.update()
+        written += count
+
+    return written
+
+# -------------------------------------------------------------------------------------------------
+# Douglas-Peucker on sampled channels, values being (frames, channels): keeps the keys needed
+# for linear interpolation to stay within tolerance. A constant channel keeps no key at all
+# The open segments of all channels are split together, one level per pass
+
+def reduceChannelKeys(frames, values, tolerance):
+    count, channel_count = values.shape
+    keep = np.zeros((count, channel_count), dtype=bool)
+
+    if count == 0:
+        return keep
+
+    varying = np.max(np.abs(values - values[0]), axis=0) > tolerance
+    if not varying.any():
+        return keep
+
+    curves = np.ascontiguousarray(values[:, varying].T)
+    kept = np.zeros(curves.shape, dtype=bool)
+    kept[:, 0] = True
+    kept[:, -1] = True
+
+    # Open segments of all curves, as (curve, first key, last key) arrays
+    segment_curves = np.arange(len(curves))
+    segment_starts = np.zeros(len(curves), dtype=np.int64)
+    segment_ends = np.full(len(curves), count - 1, dtype=np.int64)
+
+    while True:
+        open_segments = segment_ends - segment_starts >= 2
+        segment_curves = segment_curves[open_segments]
+        segment_starts = segment_starts[open_segments]
+        segment_ends = segment_ends[open_segments]
+        if len(segment_curves) == 0:
+            break
+
+        # Inner frames of every open segment, flattened
+        lengths = segment_ends - segment_starts - 1
+        offsets = np.cumsum(lengths) - lengths
+        point_segments = np.repeat(np.arange(len(lengths)), lengths)
+        points = segment_starts[point_segments] + 1 + np.arange(len(point_segments)) - offsets[point_segments]
+        point_curves = segment_curves[point_segments]
+
+        start_frames = frames[segment_starts][point_segments]
+        end_frames = frames[segment_ends][point_segments]
+        start_values = curves[point_curves, segment_starts[point_segments]]
+        end_values = curves[point_curves, segment_ends[point_segments]]
+        t = (frames[points] - start_frames) / (end_frames - start_frames)
+        errors = np.abs(curves[point_curves, points] - (start_values + t * (end_values - start_values)))
+
+        # Split each segment at its first worst frame when beyond tolerance
+        segment_max = np.maximum.reduceat(errors, offsets)
+        worst = np.flatnonzero(errors == segment_max[point_segments])
+        split_segments, first = np.unique(point_segments[worst], return_index=True)
+        splits = points[worst[first]]
+
+        split = segment_max[split_segments] > tolerance
+        split_segments = split_segments[split]
+        splits = splits[split]
+        kept[segment_curves[split_segments], splits] = True
+
+        segment_curves = np.concatenate((segment_curves[split_segments], segment_curves[split_segments]))
+        segment_starts, segment_ends = (
+            np.concatenate((segment_starts[split_segments], splits)),
+            np.concatenate((splits, segment_ends[split_segments])),
+        )
+
+    keep[:, varying] = kept.T
+    return keep
+
+# -------------------------------------------------------------------------------------------------
+
+def getPastedChannels(rotation_mode, channels):
+    return [channel for channel in ("location", "scale", getRotationChannel(rotation_mode)) if channel in channels]
+
+def getPastedChannelMask(rotation_modes, channels):
+    mask = np.zeros((len(rotation_modes), _channel_count), dtype=bool)
+    for index, rotation_mode in enumerate(rotation_modes):
+        for channel in getPastedChannels(rotation_mode, channels):
+            offset, size = _channel_offsets[channel]
+            mask[index, offset:offset + size] = True
+    return mask
+
+# -------------------------------------------------------------------------------------------------
+
+def getCopiedChannels():
+    return copied_bone_animation.get("channels", _channel_offsets.keys())
+
+def reduceCopiedBoneAnimation(self, context, tolerance):
+    if not copied_bone_animation or "values" not in copied_bone_animation:
+        self.report({'WARNING'}, "No copied keyed animation")
+        return {'CANCELLED'}
+
+    frames = np.asarray(copied_bone_animation["frames"], dtype=np.float64)
+    values = copied_bone_animation["values"]
+    frame_count = values.shape[0]
+    key_mask = np.zeros(values.shape, dtype=bool)
+
+    # Only the channels paste writes, reduced in batches of about 4M samples
+    pasted = getPastedChannelMask(copied_bone_animation["rotation_modes"], getCopiedChannels())
+    pasted_values = values[:, pasted].astype(np.float64)
+    pasted_mask = np.zeros(pasted_values.shape, dtype=bool)
+    batch = max(1, (1 << 22) // max(frame_count, 1))
+
+    for start in range(0, pasted_values.shape[1], batch):
+        pasted_mask[:, start:start + batch] = reduceChannelKeys(frames, pasted_values[:, start:start + batch], tolerance)
+
+    key_mask[:, pasted] = pasted_mask
+    copied_bone_animation["key_mask"] = key_mask
+
+    before = frame_count * int(np.count_nonzero(pasted))
+    after = int(np.count_nonzero(key_mask[:, pasted]))
+    ratio = 100.0 * (1.0 - after / before) if before > 0 else 0.0
+
+    self.report({'INFO'}, f"Reduced copied animation from {before} to {after} key(s) ({ratio:.1f}% fewer)")
+    return {'FINISHED'}
+
+# -------------------------------------------------------------------------------------------------
+
 def pasteBoneAnimationAllFrames(self, context):
     armature = getSelectedArmature(context)
     if armature is None:
@@ -276,91 +876,238 @@ def pasteBoneAnimationAllFrames(self, context):
         self.report({'WARNING'}, "No copied keyed animation")
         return {'CANCELLED'}
 
+    scene = context.scene
+    channels = [channel for channel in getFilteredChannels(scene) if channel in getCopiedChannels()]
+    frames = np.asarray(copied_bone_animation["frames"], dtype=np.float64)
+    values = copied_bone_animation["values"]
+    key_mask = copied_bone_animation.get("key_mask")
+
+    frame_range = getFilteredFrameRange(scene)
+    if frame_range is not None:
+        in_range = (frames >= frame_range[0]) & (frames <= frame_range[1])
+        frames = frames[in_range]
+        values = values[in_range]
+        # Reduced channels are keyed on the range bounds, so that the pasted segment follows
+        # the copied samples up to the bounds, and constant channels override the kept curves
+        if key_mask is not None and len(frames) > 0:
+            key_mask = key_mask[in_range]
+            key_mask[[0, -1]] = True
+
+    if len(frames) == 0 or not channels:
+        self.report({'WARNING'}, "No copied frame or channel left by the filters")
+        return {'CANCELLED'}
+
     armature.animation_data_create()
     if armature.animation_data.action is None:
         armature.animation_data.action = bpy.data.actions.new(name=armature.name + "_PosePaste")
 
-    removed_curves = clearArmatureActionKeys(armature)
+    # A filtered paste only replaces the curves it writes, or with a frame range only their
+    # keys within the range
+    if isBoneAnimationFiltered(scene):
+        removed_curves = 0
+    else:
+        removed_curves = clearArmatureActionKeys(armature)
 
-    scene = context.scene
-    original_frame = scene.frame_current
-    original_subframe = scene.frame_subframe
+    action = armature.animation_data.action
+
+    # Reduced animation is only guaranteed within tolerance with linear interpolation
+    edit_preferences = context.preferences.edit
+    interpolation = getKeyframeEnumValue("interpolation", 'LINEAR' if key_mask is not None else edit_preferences.keyframe_new_interpolation_type)
+    handle_type = getKeyframeEnumValue("handle_left_type", edit_preferences.keyframe_new_handle_type)
 
-    frame_count = 0
+    frame_count = len(frames)
     keyed_bone_count = 0
 
-    try:
-        for frame in copied_bone_animation["frames"]:
-            setSceneFrame(scene, frame)
-            frame_data = copied_bone_animation["bones_by_frame"].get(frame, {})
+    bone_name_index = getBoneNameIndex(context, armature, copied_bone_animation["bone_names"])
 
-            for bone_name, data in frame_data.items():
-                bone = armature.pose.bones.get(bone_name)
-                if bone is None:
-                    continue
+    for index, bone_name in enumerate(copied_bone_animation["bone_names"]):
+        bone = getIndexedPoseBone(armature, bone_name_index, bone_name)
+        if bone is None or (scene.bone_animation_only_selected and not bone.bone.select):
+            continue
 
-                bone.location = data["location"]
-                bone.scale = data["scale"]
-                bone.rotation_mode = data["rotation_mode"]
+        rotation_mode = copied_bone_animation["rotation_modes"][index]
+        pasted_channels = getPastedChannels(rotation_mode, channels)
+        if getRotationChannel(rotation_mode) in pasted_channels:
+            bone.rotation_mode = rotation_mode
+        prefix = f'pose.bones["{bone.name}"].'
 
-                bone.keyframe_insert(data_path="location")
-                bone.keyframe_insert(data_path="scale")
+        for channel in pasted_channels:
+            offset, size = _channel_offsets[channel]
+            channel_values = values[:, index, offset:offset + size]
+            channel_mask = None if key_mask is None else key_mask[:, index, offset:offset + size]
 
-                if bone.rotation_mode == 'QUATERNION':
-                    bone.rotation_quaternion = data["rotation_quaternion"]
-                    bone.keyframe_insert(data_path="rotation_quaternion")
-                elif bone.rotation_mode == 'AXIS_ANGLE':
-                    bone.rotation_axis_angle = data["rotation_axis_angle"]
-                    bone.keyframe_insert(data_path="rotation_axis_angle")
-                else:
-                    bone.rotation_euler = data["rotation_euler"]
-                    bone.keyframe_insert(data_path="rotation_euler")
+            writeChannelKeys(action, prefix + channel, bone.name, frames, channel_values, interpolation, handle_type, channel_mask, frame_range)
 
-                keyed_bone_count += 1
+            # Channels reduced to no key keep their constant value as a static pose value
+            if channel_mask is not None and frame_range is None:
+                prop = getattr(bone, channel)
+                for i in range(size):
+                    if not channel_mask[:, i].any():
+                        prop[i] = channel_values[0, i]
 
-            frame_count += 1
-    finally:
-        scene.frame_set(original_frame, subframe=original_subframe)
+        keyed_bone_count += frame_count
 
+    # One evaluation so the pose reflects the new curves
+    scene = context.scene
+    scene.frame_set(scene.frame_current, subframe=scene.frame_subframe)
     context.view_layer.update()
     self.report({'INFO'}, "Cleared " + str(removed_curves) + " FCurves, pasted " + str(frame_count) + " frame(s), keyed " + str(keyed_bone_count) + " bone pose(s)")
     return {'FINISHED'}
 
 # -------------------------------------------------------------------------------------------------
-
-def deleteAllScaleKeysFromSelectedBones(self, context):
-    armature = context.active_object
-    if armature is None or armature.type != 'ARMATURE':
-        self.report({'WARNING'}, "No active armature")
+# Bone clipboard file: a NumPy .npz archive with float32 samples and string arrays for names,
+# so it loads without pickle. Both the pose transforms and the keyed animation are saved
+
+_clipboard_format_version = 1
+
+def exportBoneClipboard(self, context, filepath):
+    arrays = {"format_version": np.array(_clipboard_format_version)}
+
+    if copied_bone_animation and "values" in copied_bone_animation:
+        arrays["frames"] = np.asarray(copied_bone_animation["frames"], dtype=np.float64)
+        arrays["bone_names"] = np.array(copied_bone_animation["bone_names"], dtype=str)
+        arrays["rotation_modes"] = np.array(copied_bone_animation["rotation_modes"], dtype=str)
+        arrays["values"] = np.asarray(copied_bone_animation["values"], dtype=np.float32)
+        arrays["channels"] = np.array(list(getCopiedChannels()), dtype=str)
+        if copied_bone_animation.get("key_mask") is not None:
+            arrays["key_mask"] = copied_bone_animation["key_mask"]
+
+    if copied_bone_transforms:
+        names = list(copied_bone_transforms.keys())
+        values = np.zeros((len(names), _channel_count), dtype=np.float32)
+        for index, name in enumerate(names):
+            data = copied_bone_transforms[name]
+            for channel, offset, size in _channel_layout:
+                if channel in data:
+                    values[index, offset:offset + size] = data[channel]
+        arrays["transform_bone_names"] = np.array(names, dtype=str)
+        arrays["transform_rotation_modes"] = np.array([copied_bone_transforms[name]['rotation_mode'] for name in names], dtype=str)
+        arrays["transform_values"] = values
+
+    if len(arrays) == 1:
+        self.report({'WARNING'}, "Nothing copied to export")
         return {'CANCELLED'}
 
-    selected_bones = context.selected_pose_bones or []
-    if not selected_bones:
-        self.report({'WARNING'}, "No selected bones")
-        return {'CANCELLED'}
+    np.savez_compressed(filepath, **arrays)
 
-    if armature.animation_data is None or armature.animation_data.action is None:
-        self.report({'WARNING'}, "Active armature has no action")
+    self.report({'INFO'}, "Exported bone clipboard to " + filepath)
+    return {'FINISHED'}
+
+# -------------------------------------------------------------------------------------------------
+
+def importBoneClipboard(self, context, filepath):
+    global copied_bone_animation
+
+    try:
+        archive = np.load(filepath, allow_pickle=False)
+    except (OSError, ValueError) as e:
+        self.report({'ERROR'}, "Cannot read " + filepath + ": " + str(e))
         return {'CANCELLED'}
 
-    action = armature.animation_data.action
-    target_paths = {f'pose.bones["{bone.name}"].scale' for bone in selected_bones}
+    with archive:
+        if "format_version" not in archive.files or int(archive["format_version"]) > _clipboard_format_version:
+            self.report({'ERROR'}, "Unsupported bone clipboard file")
+            return {'CANCELLED'}
 
+        # Checked before anything is replaced, so a broken file leaves the clipboard as it was
+        required = []
+        if "values" in archive.files:
+            required += ["frames", "bone_names", "rotation_modes"]
+        if "transform_values" in archive.files:
+            required += ["transform_bone_names", "transform_rotation_modes"]
+        missing = [key for key in required if key not in archive.files]
+        if missing:
+            self.report({'ERROR'}, "Incomplete bone clipboard file, missing: " + ", ".join(missing))
+            return {'CANCELLED'}
+
+        if "values" in archive.files:
+            copied_bone_animation = {
+                "frames": archive["frames"].tolist(),
+                "bone_names": archive["bone_names"].tolist(),
+                "rotation_modes": archive["rotation_modes"].tolist(),
+                "values": archive["values"],
+            }
+            if "channels" in archive.files:
+                copied_bone_animation["channels"] = tuple(archive["channels"].tolist())
+            if "key_mask" in archive.files:
+                copied_bone_animation["key_mask"] = archive["key_mask"]
+
+        if "transform_values" in archive.files:
+            copied_bone_transforms.clear()
+            values = archive["transform_values"]
+            rotation_modes = archive["transform_rotation_modes"].tolist()
+            for index, name in enumerate(archive["transform_bone_names"].tolist()):
+                row = values[index]
+                copied_bone_transforms[name] = {
+                    'location': mathutils.Vector(row[0:3]),
+                    'rotation_mode': rotation_modes[index],
+                    'rotation_quaternion': mathutils.Quaternion(row[3:7]),
+                    'rotation_euler': mathutils.Euler(row[7:10]),
+                    'rotation_axis_angle': tuple(row[10:14].tolist()),
+                }
+
+    frame_count = len(copied_bone_animation["frames"]) if copied_bone_animation else 0
+    self.report({'INFO'}, "Imported " + str(frame_count) + " frame(s) and " + str(len(copied_bone_transforms)) + " bone transform(s)")
+    return {'FINISHED'}
+
+# -------------------------------------------------------------------------------------------------
+
+# FCurve index of an action: {(bone name, channel): [(data path, array index)]}, bone name
+# being None for curves that do not animate a pose bone. Paths are stored rather than FCurves
+# so a stale entry is only a failed find. Rebuilt when the action fcurve list changes
+
+_fcurve_index_cache = {}
+
+def parseFcurvePath(data_path):
+    if data_path.startswith('pose.bones["'):
+        end = data_path.find('"].', 12)
+        if end != -1:
+            return data_path[12:end], data_path[end + 3:]
+    return None, data_path.rsplit(".", 1)[-1]
+
+# The curve count and the last curve tell a changed curve list, as new curves are appended
+
+def getFcurveListStamp(action):
+    fcurves = action.fcurves
+    if len(fcurves) == 0:
+        return (0, None, 0)
+    return (len(fcurves), fcurves[-1].data_path, fcurves[-1].array_index)
+
+def getActionFcurveIndex(action):
+    key = action.as_pointer()
+    stamp = getFcurveListStamp(action)
+    cached = _fcurve_index_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    index = {}
+    for fcurve in action.fcurves:
+        index.setdefault(parseFcurvePath(fcurve.data_path), []).append((fcurve.data_path, fcurve.array_index))
+
+    _fcurve_index_cache[key] = [stamp, index]
+    return index
+
+def removeIndexedFcurves(action, keys):
+    index = getActionFcurveIndex(action)
     removed_curves = 0
     removed_keys = 0
 
-    for fcurve in list(action.fcurves):
-        if fcurve.data_path in target_paths:
+    for key in keys:
+        for data_path, array_index in index.pop(key, ()):
+            fcurve = action.fcurves.find(data_path, index=array_index)
+            if fcurve is None:
+                continue
             removed_keys += len(fcurve.keyframe_points)
             action.fcurves.remove(fcurve)
             removed_curves += 1
 
-    self.report({'INFO'}, "Deleted " + str(removed_keys) + " scale key(s) from " + str(len(selected_bones)) + " selected bone(s)")
-    return {'FINISHED'}
+    # The index stays valid, only its stamp moves
+    _fcurve_index_cache[action.as_pointer()][0] = getFcurveListStamp(action)
+    return removed_curves, removed_keys
 
 # -------------------------------------------------------------------------------------------------
 
-def deleteAllLocationKeysFromSelectedBones(self, context):
+def deleteChannelKeysFromSelectedBones(self, context, channel):
     armature = context.active_object
     if armature is None or armature.type != 'ARMATURE':
         self.report({'WARNING'}, "No active armature")
@@ -375,50 +1122,381 @@ def deleteAllLocationKeysFromSelectedBones(self, context):
         self.report({'WARNING'}, "Active armature has no action")
         return {'CANCELLED'}
 
-    action = armature.animation_data.action
-    target_paths = {f'pose.bones["{bone.name}"].location' for bone in selected_bones}
+    channels = dict(_channel_groups)[channel]
+    keys = [(bone.name, name) for bone in selected_bones for name in channels]
+    removed_curves, removed_keys = removeIndexedFcurves(armature.animation_data.action, keys)
 
-    removed_keys = 0
-    for fcurve in list(action.fcurves):
-        if fcurve.data_path in target_paths:
-            removed_keys += len(fcurve.keyframe_points)
-            action.fcurves.remove(fcurve)
+    self.report({'INFO'}, "Deleted " + str(removed_keys) + " " + channel + " key(s) from " + str(len(selected_bones)) + " selected bone(s)")
+    return {'FINISHED'}
+
+# -------------------------------------------------------------------------------------------------
+# Works on the action datablocks directly: no action assignment, no frame change
+
+def deleteChannelKeysFromActions(self, context, channel, name_filter):
+    channels = dict(_channel_groups)[channel]
+    action_count = 0
+    total_keys = 0
+
+    for action in bpy.data.actions:
+        if name_filter and not fnmatch.fnmatchcase(action.name, name_filter):
+            continue
 
-    self.report({'INFO'}, "Deleted " + str(removed_keys) + " location key(s) from " + str(len(selected_bones)) + " selected bone(s)")
+        index = getActionFcurveIndex(action)
+        keys = [key for key in index if key[0] is not None and key[1] in channels]
+        if not keys:
+            continue
+
+        removed_curves, removed_keys = removeIndexedFcurves(action, keys)
+        self.report({'INFO'}, action.name + ": deleted " + str(removed_keys) + " " + channel + " key(s) in " + str(removed_curves) + " FCurve(s)")
+        action_count += 1
+        total_keys += removed_keys
+
+    self.report({'INFO'}, "Deleted " + str(total_keys) + " " + channel + " key(s) from " + str(action_count) + " action(s)")
     return {'FINISHED'}
 
 # -------------------------------------------------------------------------------------------------
 
-def deleteAllRotationKeysFromSelectedBones(self, context):
-    armature = context.active_object
-    if armature is None or armature.type != 'ARMATURE':
-        self.report({'WARNING'}, "No active armature")
-        return {'CANCELLED'}
+# Pose delta engine: start pose and delta are {"bone_names": [...], "values": (bones, 10)}
+# with rows of quaternion (w, x, y, z), location and scale
+
+# Euler order -> (axes in application order, odd parity), as in Blender rotation order info
+_euler_orders = {
+    'XYZ': ((0, 1, 2), False),
+    'XZY': ((0, 2, 1), True),
+    'YXZ': ((1, 0, 2), True),
+    'YZX': ((1, 2, 0), False),
+    'ZXY': ((2, 0, 1), False),
+    'ZYX': ((2, 1, 0), True),
+}
 
-    selected_bones = context.selected_pose_bones or []
-    if not selected_bones:
-        self.report({'WARNING'}, "No selected bones")
-        return {'CANCELLED'}
+def multiplyQuaternions(a, b):
+    aw, ax, ay, az = a[:, 0], a[:, 1], a[:, 2], a[:, 3]
+    bw, bx, by, bz = b[:, 0], b[:, 1], b[:, 2], b[:, 3]
+    return np.stack((
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ), axis=1)
+
+def invertQuaternions(q):
+    length_squared = np.sum(q * q, axis=1, keepdims=True)
+    length_squared[length_squared == 0.0] = 1.0
+    return q * np.array([1.0, -1.0, -1.0, -1.0]) / length_squared
+
+def eulerToQuaternions(euler, orders):
+    quaternions = np.zeros((len(euler), 4))
+    quaternions[:, 0] = 1.0
+
+    for order, (axes, _) in _euler_orders.items():
+        rows = orders == order
+        if not rows.any():
+            continue
+        q = quaternions[rows]
+        for axis in axes:
+            half = euler[rows, axis] * 0.5
+            axis_q = np.zeros((len(half), 4))
+            axis_q[:, 0] = np.cos(half)
+            axis_q[:, 1 + axis] = np.sin(half)
+            q = multiplyQuaternions(axis_q, q)
+        quaternions[rows] = q
+
+    return quaternions
+
+# Same two-solution pick as mathutils Quaternion.to_euler(order)
+
+def quaternionsToEuler(quaternions, orders):
+    q = quaternions / np.linalg.norm(quaternions, axis=1, keepdims=True).clip(1e-12)
+    w, x, y, z = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+
+    # Column major, as Blender matrices: m[:, column, row]
+    m = np.empty((len(q), 3, 3))
+    m[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    m[:, 0, 1] = 2.0 * (x * y + w * z)
+    m[:, 0, 2] = 2.0 * (x * z - w * y)
+    m[:, 1, 0] = 2.0 * (x * y - w * z)
+    m[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    m[:, 1, 2] = 2.0 * (y * z + w * x)
+    m[:, 2, 0] = 2.0 * (x * z + w * y)
+    m[:, 2, 1] = 2.0 * (y * z - w * x)
+    m[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+
+    euler = np.zeros((len(q), 3))
+
+    for order, ((i, j, k), parity) in _euler_orders.items():
+        rows = orders == order
+        if not rows.any():
+            continue
+        r = m[rows]
+        cy = np.hypot(r[:, i, i], r[:, i, j])
+
+        euler1 = np.empty((len(r), 3))
+        euler1[:, i] = np.arctan2(r[:, j, k], r[:, k, k])
+        euler1[:, j] = np.arctan2(-r[:, i, k], cy)
+        euler1[:, k] = np.arctan2(r[:, i, j], r[:, i, i])
+
+        euler2 = np.empty((len(r), 3))
+        euler2[:, i] = np.arctan2(-r[:, j, k], -r[:, k, k])
+        euler2[:, j] = np.arctan2(-r[:, i, k], -cy)
+        euler2[:, k] = np.arctan2(-r[:, i, j], -r[:, i, i])
+
+        # Gimbal lock: one solution only
+        locked = cy <= 16.0 * np.finfo(np.float32).eps
+        euler1[locked, i] = np.arctan2(-r[locked, k, j], r[locked, j, j])
+        euler1[locked, k] = 0.0
+        euler2[locked] = euler1[locked]
+
+        if parity:
+            euler1 = -euler1
+            euler2 = -euler2
+
+        use_second = np.sum(np.abs(euler1), axis=1) > np.sum(np.abs(euler2), axis=1)
+        euler[rows] = np.where(use_second[:, np.newaxis], euler2, euler1)
+
+    return euler
+
+def axisAnglesToQuaternions(axis_angles):
+    axis = axis_angles[:, 1:4]
+    length = np.linalg.norm(axis, axis=1)
+    valid = length > 0.0
+    half = axis_angles[:, 0] * 0.5
+
+    quaternions = np.zeros((len(axis_angles), 4))
+    quaternions[:, 0] = 1.0
+    quaternions[valid, 0] = np.cos(half[valid])
+    quaternions[valid, 1:4] = axis[valid] / length[valid, np.newaxis] * np.sin(half[valid])[:, np.newaxis]
+    return quaternions
+
+def quaternionsToAxisAngles(quaternions):
+    q = quaternions / np.linalg.norm(quaternions, axis=1, keepdims=True).clip(1e-12)
+    half = np.arccos(np.clip(q[:, 0], -1.0, 1.0))
+    sine = np.sin(half)
+    sine[np.abs(sine) < 0.0005] = 1.0
+
+    axis_angles = np.empty((len(q), 4))
+    axis_angles[:, 0] = half * 2.0
+    axis_angles[:, 1:4] = q[:, 1:4] / sine[:, np.newaxis]
+    axis_angles[np.all(axis_angles[:, 1:4] == 0.0, axis=1), 2] = 1.0
+    return axis_angles
+
+# -------------------------------------------------------------------------------------------------
+
+def getPoseRotationModes(armature):
+    return np.array([bone.rotation_mode for bone in armature.pose.bones])
+
+def poseChannelsToDeltaRows(values, modes):
+    rows = np.empty((len(values), 10))
+    rows[:, 0:4] = values[:, 3:7]
+
+    euler = ~np.isin(modes, ('QUATERNION', 'AXIS_ANGLE'))
+    rows[euler, 0:4] = eulerToQuaternions(values[euler, 7:10], modes[euler])
+
+    axis_angle = modes == 'AXIS_ANGLE'
+    rows[axis_angle, 0:4] = axisAnglesToQuaternions(values[axis_angle, 10:14])
+
+    rows[:, 4:7] = values[:, 0:3]
+    rows[:, 7:10] = values[:, 14:17]
+    return rows
+
+# Writes rows back into the pose channels of the given bone indices, each rotation in its bone mode
+
+def deltaRowsToPoseChannels(rows, modes, values, indices):
+    values[indices, 0:3] = rows[:, 4:7]
+    values[indices, 14:17] = rows[:, 7:10]
+    modes = modes[indices]
+
+    quaternion = modes == 'QUATERNION'
+    values[indices[quaternion], 3:7] = rows[quaternion, 0:4]
+
+    axis_angle = modes == 'AXIS_ANGLE'
+    values[indices[axis_angle], 10:14] = quaternionsToAxisAngles(rows[axis_angle, 0:4])
+
+    euler = ~(quaternion | axis_angle)
+    values[indices[euler], 7:10] = quaternionsToEuler(rows[euler, 0:4], modes[euler])
+
+def matchBoneRows(bone_names, other_names):
+    if bone_names == other_names:
+        indices = np.arange(len(bone_names))
+        return indices, indices
+
+    other_index = {name: index for index, name in enumerate(other_names)}
+    pairs = [(index, other_index[name]) for index, name in enumerate(bone_names) if name in other_index]
+    if not pairs:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    indices, other_indices = np.array(pairs).T
+    return indices, other_indices
+
+def computePoseDelta(start_rows, end_rows):
+    delta = np.empty_like(end_rows)
+    delta[:, 0:4] = multiplyQuaternions(end_rows[:, 0:4], invertQuaternions(start_rows[:, 0:4]))
+    delta[:, 4:7] = end_rows[:, 4:7] - start_rows[:, 4:7]
+    start_scale = start_rows[:, 7:10]
+    delta[:, 7:10] = np.divide(end_rows[:, 7:10], start_scale, out=np.ones_like(start_scale), where=start_scale != 0.0)
+    return delta
+
+def applyPoseDelta(delta_rows, rows):
+    result = np.empty_like(rows)
+    result[:, 0:4] = multiplyQuaternions(delta_rows[:, 0:4], rows[:, 0:4])
+    result[:, 4:7] = rows[:, 4:7] + delta_rows[:, 4:7]
+    result[:, 7:10] = rows[:, 7:10] * delta_rows[:, 7:10]
+    return result
+
+# -------------------------------------------------------------------------------------------------
+# Applies the pose delta to the keys of the active action within a frame range, in action space
+# Keys move with their handles. Channels without keys are left alone, except the components
+# of a keyed rotation, which are keyed on every frame where any of them is, so the rotation
+# stays exact. Curves created for missing components keep their static value outside the range
+
+# New value = value * factor + offset, for the given keys and their handles
+
+def adjustFcurveKeys(fcurve, co, rows, offsets=0.0, factor=1.0):
+    points = fcurve.keyframe_points
+
+    for prop in ("handle_left", "handle_right"):
+        handles = np.empty(len(points) * 2, dtype=np.float64)
+        points.foreach_get(prop, handles)
+        handles = handles.reshape(-1, 2)
+        handles[rows, 1] = handles[rows, 1] * factor + offsets
+        points.foreach_set(prop, handles.ravel())
+
+    co[rows, 1] = co[rows, 1] * factor + offsets
+    points.foreach_set("co", co.ravel())
+    fcurve.update()
+
+def addFcurveKeys(fcurve, frames, values):
+    points = fcurve.keyframe_points
+    existing = len(points)
+    points.add(len(frames))
+
+    co = np.empty(len(points) * 2, dtype=np.float64)
+    points.foreach_get("co", co)
+    co = co.reshape(-1, 2)
+    co[existing:, 0] = frames
+    co[existing:, 1] = values
+    points.foreach_set("co", co.ravel())
+    fcurve.update()
+
+def applyRotationDeltaToKeys(action, bone, delta_rotation, frame_start, frame_end):
+    rotation_mode = bone.rotation_mode
+    channel = getRotationChannel(rotation_mode)
+    size = 3 if channel == "rotation_euler" else 4
+    data_path = f'pose.bones["{bone.name}"].{channel}'
+
+    fcurves = [action.fcurves.find(data_path, index=index) for index in range(size)]
+    keys = [readFcurveKeys(fcurve) if fcurve is not None else None for fcurve in fcurves]
+    if all(key is None for key in keys):
+        return 0
+
+    keyed_frames = np.unique(np.concatenate([key[:, 0] for key in keys if key is not None]))
+    in_range = (keyed_frames >= frame_start) & (keyed_frames <= frame_end)
+    frames = keyed_frames[in_range]
+    if len(frames) == 0:
+        return 0
+
+    # Full rotation on every frame keyed by any component
+    static = getattr(bone, channel)
+    values = np.empty((len(frames), size))
+    for index, fcurve in enumerate(fcurves):
+        values[:, index] = evaluateFcurve(fcurve, frames) if fcurve is not None else static[index]
+
+    if channel == "rotation_quaternion":
+        rotations = values
+    elif channel == "rotation_axis_angle":
+        rotations = axisAnglesToQuaternions(values)
+    else:
+        rotations = eulerToQuaternions(values, np.full(len(frames), rotation_mode))
+
+    rotations = multiplyQuaternions(np.repeat(delta_rotation[np.newaxis], len(frames), axis=0), rotations)
+
+    if channel == "rotation_quaternion":
+        new_values = rotations
+    elif channel == "rotation_axis_angle":
+        new_values = quaternionsToAxisAngles(rotations)
+    else:
+        # Closest to the original angles so the curves do not jump by full turns
+        new_values = quaternionsToEuler(rotations, np.full(len(frames), rotation_mode))
+        new_values += 2.0 * np.pi * np.round((values - new_values) / (2.0 * np.pi))
+
+    # Static keys of created curves: the closest keyed frames outside the range, where the
+    # other components are untouched, or just outside the range
+    before = keyed_frames[keyed_frames < frame_start]
+    after = keyed_frames[keyed_frames > frame_end]
+    seed_frames = [before[-1] if len(before) > 0 else frame_start - 1, after[0] if len(after) > 0 else frame_end + 1]
+
+    changed_keys = 0
+
+    for index, fcurve in enumerate(fcurves):
+        if fcurve is None:
+            if np.allclose(new_values[:, index], static[index]):
+                continue
+            fcurve = action.fcurves.new(data_path, index=index, action_group=bone.name)
+            addFcurveKeys(fcurve, np.concatenate((seed_frames, frames)), np.concatenate(([static[index]] * 2, new_values[:, index])))
+            changed_keys += len(frames)
+            continue
+
+        co = keys[index]
+        rows = (co[:, 0] >= frame_start) & (co[:, 0] <= frame_end)
+        if rows.any():
+            positions = np.searchsorted(frames, co[rows, 0])
+            adjustFcurveKeys(fcurve, co, rows, offsets=new_values[positions, index] - co[rows, 1])
+
+        # Frames keyed by other components only
+        missing = ~np.isin(frames, co[rows, 0])
+        if missing.any():
+            addFcurveKeys(fcurve, frames[missing], new_values[missing, index])
+
+        changed_keys += len(frames)
+
+    return changed_keys
+
+def pasteDeltaOnKeys(self, context, frame_start, frame_end):
+    armature = context.active_object
 
     if armature.animation_data is None or armature.animation_data.action is None:
         self.report({'WARNING'}, "Active armature has no action")
         return {'CANCELLED'}
 
     action = armature.animation_data.action
-    rotation_paths = set()
-    for bone in selected_bones:
-        prefix = f'pose.bones["{bone.name}"].'
-        rotation_paths.add(prefix + "rotation_euler")
-        rotation_paths.add(prefix + "rotation_quaternion")
-        rotation_paths.add(prefix + "rotation_axis_angle")
+    index = getActionFcurveIndex(action)
+    changed_keys = 0
+    changed_bones = 0
 
-    removed_keys = 0
-    for fcurve in list(action.fcurves):
-        if fcurve.data_path in rotation_paths:
-            removed_keys += len(fcurve.keyframe_points)
-            action.fcurves.remove(fcurve)
+    for row, bone_name in enumerate(pose_delta["bone_names"]):
+        bone = armature.pose.bones.get(bone_name)
+        if bone is None:
+            continue
+
+        delta = pose_delta["values"][row]
+        bone_keys = 0
+
+        for channel, offset in (("location", 4), ("scale", 7)):
+            for data_path, array_index in index.get((bone_name, channel), ()):
+                fcurve = action.fcurves.find(data_path, index=array_index)
+                if fcurve is None or array_index >= 3:
+                    continue
+
+                co = readFcurveKeys(fcurve)
+                rows = (co[:, 0] >= frame_start) & (co[:, 0] <= frame_end)
+                if not rows.any():
+                    continue
 
-    self.report({'INFO'}, "Deleted " + str(removed_keys) + " rotation key(s) from " + str(len(selected_bones)) + " selected bone(s)")
+                if channel == "location":
+                    adjustFcurveKeys(fcurve, co, rows, offsets=delta[offset + array_index])
+                else:
+                    adjustFcurveKeys(fcurve, co, rows, factor=delta[offset + array_index])
+                bone_keys += int(np.count_nonzero(rows))
+
+        bone_keys += applyRotationDeltaToKeys(action, bone, delta[0:4], frame_start, frame_end)
+
+        if bone_keys > 0:
+            changed_keys += bone_keys
+            changed_bones += 1
+
+    # One evaluation so the pose reflects the new keys
+    scene = context.scene
+    scene.frame_set(scene.frame_current, subframe=scene.frame_subframe)
+
+    self.report({'INFO'}, "Applied pose delta to " + str(changed_keys) + " key(s) on " + str(changed_bones) + " bone(s)")
     return {'FINISHED'}
 
 # -------------------------------------------------------------------------------------------------
@@ -435,18 +1513,12 @@ class POSE_OT_MarkStartPose(Operator):
     def execute(self, context):
         global start_pose
         armature = context.active_object
-        pose_bones = armature.pose.bones
-        
-        # Clear previous start pose
-        start_pose.clear()
-        
+
         # Store current pose (rotation, location, scale)
-        for bone in pose_bones:
-            start_pose[bone.name] = {
-                'rotation': bone.rotation_quaternion.copy() if bone.rotation_mode == 'QUATERNION' else bone.rotation_euler.to_quaternion(),
-                'location': bone.location.copy(),
-                'scale': bone.scale.copy()
-            }
+        start_pose = {
+            "bone_names": [bone.name for bone in armature.pose.bones],
+            "values": poseChannelsToDeltaRows(readPoseChannels(armature), getPoseRotationModes(armature)),
+        }
         
         self.report({'INFO'}, "Marked current pose as start pose")
         return {'FINISHED'}
@@ -465,30 +1537,15 @@ class POSE_OT_CopyDelta(Operator):
     def execute(self, context):
         global pose_delta
         armature = context.active_object
-        pose_bones = armature.pose.bones
-        
-        # Clear previous delta
-        pose_delta.clear()
-        
-        # Calculate delta for each bone
-        for bone in pose_bones:
-            if bone.name in start_pose:
-                # Get start and end (current) pose
-                start_data = start_pose[bone.name]
-                end_rot = bone.rotation_quaternion.copy() if bone.rotation_mode == 'QUATERNION' else bone.rotation_euler.to_quaternion()
-                end_loc = bone.location.copy()
-                end_scale = bone.scale.copy()
-                
-                # Calculate delta
-                delta_rot = end_rot @ start_data['rotation'].inverted()
-                delta_loc = end_loc - start_data['location']
-                delta_scale = mathutils.Vector([end_scale[i] / start_data['scale'][i] if start_data['scale'][i] != 0 else 1.0 for i in range(3)])
-                
-                pose_delta[bone.name] = {
-                    'rotation': delta_rot,
-                    'location': delta_loc,
-                    'scale': delta_scale
-                }
+        bone_names = [bone.name for bone in armature.pose.bones]
+        end_rows = poseChannelsToDeltaRows(readPoseChannels(armature), getPoseRotationModes(armature))
+
+        # Calculate delta for each bone of the start pose
+        indices, start_indices = matchBoneRows(bone_names, start_pose["bone_names"])
+        pose_delta = {
+            "bone_names": [bone_names[index] for index in indices],
+            "values": computePoseDelta(start_pose["values"][start_indices], end_rows[indices]),
+        }
         
         self.report({'INFO'}, "Copied delta from start pose to current pose")
         return {'FINISHED'}
@@ -506,33 +1563,114 @@ class POSE_OT_PasteDelta(Operator):
     
     def execute(self, context):
         armature = context.active_object
-        pose_bones = armature.pose.bones
-        
+        bone_names = [bone.name for bone in armature.pose.bones]
+        values = readPoseChannels(armature)
+        modes = getPoseRotationModes(armature)
+
         # Apply delta to each bone
-        for bone in pose_bones:
-            if bone.name in pose_delta:
-                delta_data = pose_delta[bone.name]
-                
-                # Apply rotation
-                current_rot = bone.rotation_quaternion.copy() if bone.rotation_mode == 'QUATERNION' else bone.rotation_euler.to_quaternion()
-                new_rot = delta_data['rotation'] @ current_rot
-                if bone.rotation_mode == 'QUATERNION':
-                    bone.rotation_quaternion = new_rot
-                else:
-                    bone.rotation_euler = new_rot.to_euler(bone.rotation_mode)
-                
-                # Apply location
-                bone.location += delta_data['location']
-                
-                # Apply scale
-                for i in range(3):
-                    bone.scale[i] *= delta_data['scale'][i]
+        indices, delta_indices = matchBoneRows(bone_names, pose_delta["bone_names"])
+        rows = poseChannelsToDeltaRows(values[indices], modes[indices])
+        deltaRowsToPoseChannels(applyPoseDelta(pose_delta["values"][delta_indices], rows), modes, values, indices)
+        writePoseChannels(armature, values)
+
+        armature.update_tag()
+        context.view_layer.update()
         
         self.report({'INFO'}, "Pasted pose delta")
         return {'FINISHED'}
 
 # -------------------------------------------------------------------------------------------------
 
+class POSE_OT_PasteDeltaOnKeys(Operator):
+    bl_idname = "pose.paste_delta_on_keys"
+    bl_label = "Paste Pose Delta on Keys"
+    bl_description = "Apply the copied pose delta to the keys of the active action within a frame range"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    frame_start: bpy.props.IntProperty(
+        name="Start",
+        description="First frame whose keys are changed",
+        default=1,
+    )
+
+    frame_end: bpy.props.IntProperty(
+        name="End",
+        description="Last frame whose keys are changed",
+        default=250,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object and context.active_object.type == 'ARMATURE' and pose_delta
+
+    def invoke(self, context, event):
+        scene = context.scene
+        if scene.use_preview_range:
+            self.frame_start = scene.frame_preview_start
+            self.frame_end = scene.frame_preview_end
+        else:
+            self.frame_start = scene.frame_start
+            self.frame_end = scene.frame_end
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        return pasteDeltaOnKeys(self, context, self.frame_start, self.frame_end)
+
+# -------------------------------------------------------------------------------------------------
+
+_channel_group_items = (
+    ('location', "Location", "Location keys"),
+    ('rotation', "Rotation", "Quaternion, euler and axis angle rotation keys"),
+    ('scale', "Scale", "Scale keys"),
+)
+
+class POSE_OT_DeleteChannelKeys(Operator):
+    bl_idname = "pose.delete_channel_keys"
+    bl_label = "Delete channel keys"
+    bl_description = "Deletes all keys of a channel of selected bones on active armature action"
+    bl_options = {'REGISTER'}
+
+    channel: bpy.props.EnumProperty(
+        name="Channel",
+        items=_channel_group_items,
+        default='location',
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'POSE' and context.active_object and context.active_object.type == 'ARMATURE'
+
+    def execute(self, context):
+        return deleteChannelKeysFromSelectedBones(self, context, self.channel)
+
+# -------------------------------------------------------------------------------------------------
+
+class OBJECT_OT_DeleteChannelKeysAllActions(Operator):
+    bl_idname = "object.delete_channel_keys_all_actions"
+    bl_label = "Delete channel keys in all actions"
+    bl_description = "Deletes all bone keys of a channel in every action of the file, or in the actions matching a name filter"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    channel: bpy.props.EnumProperty(
+        name="Channel",
+        items=_channel_group_items,
+        default='scale',
+    )
+
+    name_filter: bpy.props.StringProperty(
+        name="Action names",
+        description="Only actions matching this pattern (* and ? wildcards), all actions if empty",
+        default="",
+    )
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        return deleteChannelKeysFromActions(self, context, self.channel, self.name_filter)
+
+# -------------------------------------------------------------------------------------------------
+
 class POSE_OT_DeleteAllScaleKeys(Operator):
     bl_idname = "pose.delete_all_scale_keys"
     bl_label = "Delete all scale keys"
@@ -544,7 +1682,7 @@ class POSE_OT_DeleteAllScaleKeys(Operator):
         return context.mode == 'POSE' and context.active_object and context.active_object.type == 'ARMATURE'
 
     def execute(self, context):
-        return deleteAllScaleKeysFromSelectedBones(self, context)
+        return deleteChannelKeysFromSelectedBones(self, context, "scale")
 
 # -------------------------------------------------------------------------------------------------
 
@@ -559,7 +1697,7 @@ class POSE_OT_DeleteAllLocationKeys(Operator):
         return context.mode == 'POSE' and context.active_object and context.active_object.type == 'ARMATURE'
 
     def execute(self, context):
-        return deleteAllLocationKeysFromSelectedBones(self, context)
+        return deleteChannelKeysFromSelectedBones(self, context, "location")
 
 class POSE_OT_DeleteAllRotationKeys(Operator):
     bl_idname = "pose.delete_all_rotation_keys"
@@ -572,7 +1710,7 @@ class POSE_OT_DeleteAllRotationKeys(Operator):
         return context.mode == 'POSE' and context.active_object and context.active_object.type == 'ARMATURE'
 
     def execute(self, context):
-        return deleteAllRotationKeysFromSelectedBones(self, context)
+        return deleteChannelKeysFromSelectedBones(self, context, "rotation")
 
 # -------------------------------------------------------------------------------------------------
 
@@ -583,56 +1721,94 @@ class POSE_OT_ScaleEachBoneModal(Operator):
     bl_description = "Scales each selected bone individually. Move mouse up/down to adjust, LMB/Enter to confirm"
     bl_options = {'REGISTER', 'UNDO', 'BLOCKING'}
 
+    # Scales are written at most once per display refresh while dragging
+    refresh_interval = 1.0 / 60.0
+
     @classmethod
     def poll(cls, context):
         return context.mode == 'POSE' and context.selected_pose_bones
 
     def invoke(self, context, event):
-        self.initial_scales = {bone.name: bone.scale.copy() for bone in context.selected_pose_bones}
-        if not self.initial_scales:
+        # Per armature: the scales of all its bones and a mask of the selected ones,
+        # so each update is one bulk write
+        selected = {}
+        for bone in context.selected_pose_bones:
+            selected.setdefault(bone.id_data, set()).add(bone.name)
+        if not selected:
             self.report({'WARNING'}, "No bones selected")
             return {'CANCELLED'}
+
+        self.armatures = []
+        for armature, names in selected.items():
+            bones = armature.pose.bones
+            scales = np.empty(len(bones) * 3, dtype=np.float32)
+            bones.foreach_get("scale", scales)
+            mask = np.repeat(np.array([bone.name in names for bone in bones]), 3)
+            self.armatures.append((armature, scales, mask))
+
         self.init_mouse_y = event.mouse_y
         self.factor = 1.0
+        self.applied_factor = 1.0
         self.has_moved = False
+        self.timer = context.window_manager.event_timer_add(self.refresh_interval, window=context.window)
         context.window_manager.modal_handler_add(self)
         context.area.header_text_set(
             "Scale each bone: 1.000  |  Move mouse up/down  |  LMB/Enter: confirm  |  RMB/Esc: cancel"
         )
         return {'RUNNING_MODAL'}
 
+    def apply_factor(self, context, factor):
+        for armature, scales, mask in self.armatures:
+            armature.pose.bones.foreach_set("scale", np.where(mask, scales * factor, scales))
+            armature.update_tag()
+        self.applied_factor = factor
+        context.area.tag_redraw()
+
+    def finish(self, context):
+        context.window_manager.event_timer_remove(self.timer)
+        context.area.header_text_set(None)
+
     def modal(self, context, event):
+        # The timer and the header text must not outlive the operator, even on errors
+        try:
+            return self.handle_event(context, event)
+        except Exception:
+            self.finish(context)
+            raise
+
+    def handle_event(self, context, event):
         if event.type == 'MOUSEMOVE':
             delta = (event.mouse_y - self.init_mouse_y) * 0.005
             self.factor = max(0.001, 1.0 + delta)
             if abs(delta) > 0.001:
                 self.has_moved = True
-            for bone in context.selected_pose_bones:
-                if bone.name in self.initial_scales:
-                    bone.scale = self.initial_scales[bone.name] * self.factor
-            context.area.header_text_set(
-                f"Scale each bone: {self.factor:.3f}  |  Move mouse up/down  |  LMB/Enter: confirm  |  RMB/Esc: cancel"
-            )
-            context.area.tag_redraw()
+            return {'RUNNING_MODAL'}
+
+        elif event.type == 'TIMER':
+            if self.factor != self.applied_factor:
+                self.apply_factor(context, self.factor)
+                context.area.header_text_set(
+                    f"Scale each bone: {self.factor:.3f}  |  Move mouse up/down  |  LMB/Enter: confirm  |  RMB/Esc: cancel"
+                )
             return {'RUNNING_MODAL'}
 
         elif event.type == 'RET' and event.value == 'PRESS':
-            context.area.header_text_set(None)
+            self.apply_factor(context, self.factor)
+            self.finish(context)
             self.report({'INFO'}, f"Scaled each bone by {self.factor:.3f}")
             return {'FINISHED'}
 
         elif event.type == 'LEFTMOUSE' and event.value == 'RELEASE':
             if not self.has_moved:
                 return {'RUNNING_MODAL'}
-            context.area.header_text_set(None)
+            self.apply_factor(context, self.factor)
+            self.finish(context)
             self.report({'INFO'}, f"Scaled each bone by {self.factor:.3f}")
             return {'FINISHED'}
 
         elif event.type in {'RIGHTMOUSE', 'ESC'}:
-            for bone in context.selected_pose_bones:
-                if bone.name in self.initial_scales:
-                    bone.scale = self.initial_scales[bone.name]
-            context.area.header_text_set(None)
+            self.apply_factor(context, 1.0)
+            self.finish(context)
             return {'CANCELLED'}
 
         return {'RUNNING_MODAL'}
@@ -678,11 +1854,32 @@ class OBJECT_PT_armature_utilities(bpy.types.Panel):
         layout = self.layout
 
         layout.operator("object.copy_armature_constraints")
+        layout.operator("object.copy_armature_constraints_to_selected")
         layout.operator("object.copy_bone_positions_rotations")
         layout.operator("object.paste_bone_positions_rotations")
         layout.operator("object.copy_bone_animation_all_frames")
+        layout.operator("object.reduce_copied_bone_animation")
         layout.operator("object.paste_bone_animation_all_frames")
 
+        box = layout.box()
+        box.label(text="Animation copy/paste filters")
+        scene = context.scene
+        box.prop(scene, "bone_animation_only_selected")
+        row = box.row(align=True)
+        row.prop(scene, "bone_animation_use_location", toggle=True)
+        row.prop(scene, "bone_animation_use_rotation", toggle=True)
+        row.prop(scene, "bone_animation_use_scale", toggle=True)
+        box.prop(scene, "bone_animation_use_frame_range")
+        row = box.row(align=True)
+        row.enabled = scene.bone_animation_use_frame_range
+        row.prop(scene, "bone_animation_frame_start")
+        row.prop(scene, "bone_animation_frame_end")
+
+        layout.operator("object.export_bone_clipboard")
+        layout.operator("object.import_bone_clipboard")
+        layout.operator("object.delete_channel_keys_all_actions")
+        layout.prop(context.scene, "bone_name_mapping")
+
 class OBJECT_OT_CopyBonePositionsRotations(bpy.types.Operator):
     """Copy Bone Positions/Rotations"""
     bl_idname = "object.copy_bone_positions_rotations"
@@ -725,6 +1922,29 @@ class OBJECT_OT_CopyBoneAnimationAllFrames(bpy.types.Operator):
     def execute(self, context):
         return copyBoneAnimationAllFrames(self, context)
 
+class OBJECT_OT_ReduceCopiedBoneAnimation(bpy.types.Operator):
+    """Reduce Copied Bone Animation"""
+    bl_idname = "object.reduce_copied_bone_animation"
+    bl_label = "Reduce copied animation"
+    bl_description = "Drops constant channels and keys that linear interpolation reproduces within tolerance from the copied animation"
+    bl_options = {'REGISTER'}
+
+    tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Maximum difference allowed between the reduced and the copied animation",
+        default=0.001,
+        min=0.0,
+        precision=5,
+        step=0.01,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+
+    def execute(self, context):
+        return reduceCopiedBoneAnimation(self, context, self.tolerance)
+
 class OBJECT_OT_PasteBoneAnimationAllFrames(bpy.types.Operator):
     """Paste Bone Animation All Frames"""
     bl_idname = "object.paste_bone_animation_all_frames"
@@ -739,6 +1959,32 @@ class OBJECT_OT_PasteBoneAnimationAllFrames(bpy.types.Operator):
     def execute(self, context):
         return pasteBoneAnimationAllFrames(self, context)
 
+class OBJECT_OT_ExportBoneClipboard(bpy.types.Operator, ExportHelper):
+    """Export Bone Clipboard"""
+    bl_idname = "object.export_bone_clipboard"
+    bl_label = "Export copied bones"
+    bl_description = "Saves the copied bone transforms and animation to a file"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".npz"
+    filter_glob: StringProperty(default="*.npz", options={'HIDDEN'})
+
+    def execute(self, context):
+        return exportBoneClipboard(self, context, self.filepath)
+
+class OBJECT_OT_ImportBoneClipboard(bpy.types.Operator, ImportHelper):
+    """Import Bone Clipboard"""
+    bl_idname = "object.import_bone_clipboard"
+    bl_label = "Import copied bones"
+    bl_description = "Loads bone transforms and animation saved with 'Export copied bones', ready to paste"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".npz"
+    filter_glob: StringProperty(default="*.npz", options={'HIDDEN'})
+
+    def execute(self, context):
+        return importBoneClipboard(self, context, self.filepath)
+
 class OBJECT_PT_bone_utilities(bpy.types.Panel):
     bl_idname = "OBJECT_PT_bone_utilities"
     bl_label = "Bone Utilities"
@@ -757,6 +2003,7 @@ class OBJECT_PT_bone_utilities(bpy.types.Panel):
         box.operator(POSE_OT_MarkStartPose.bl_idname)
         box.operator(POSE_OT_CopyDelta.bl_idname)
         box.operator(POSE_OT_PasteDelta.bl_idname)
+        box.operator(POSE_OT_PasteDeltaOnKeys.bl_idname)
         box.operator(POSE_OT_DeleteAllLocationKeys.bl_idname)
         box.operator(POSE_OT_DeleteAllRotationKeys.bl_idname)
         box.operator(POSE_OT_DeleteAllScaleKeys.bl_idname)
@@ -775,20 +2022,67 @@ addon_keymaps = []
 
 def register():
     bpy.utils.register_class(OBJECT_OT_CopyArmatureConstraints)
+    bpy.utils.register_class(OBJECT_OT_CopyArmatureConstraintsToSelected)
     bpy.utils.register_class(OBJECT_OT_CopyBonePositionsRotations)
     bpy.utils.register_class(OBJECT_OT_PasteBonePositionsRotations)
     bpy.utils.register_class(OBJECT_OT_CopyBoneAnimationAllFrames)
+    bpy.utils.register_class(OBJECT_OT_ReduceCopiedBoneAnimation)
     bpy.utils.register_class(OBJECT_OT_PasteBoneAnimationAllFrames)
+    bpy.utils.register_class(OBJECT_OT_ExportBoneClipboard)
+    bpy.utils.register_class(OBJECT_OT_ImportBoneClipboard)
     bpy.utils.register_class(OBJECT_PT_armature_utilities)
     bpy.utils.register_class(OBJECT_PT_bone_utilities)
     bpy.utils.register_class(POSE_OT_MarkStartPose)
     bpy.utils.register_class(POSE_OT_CopyDelta)
     bpy.utils.register_class(POSE_OT_PasteDelta)
+    bpy.utils.register_class(POSE_OT_PasteDeltaOnKeys)
     bpy.utils.register_class(POSE_OT_DeleteAllLocationKeys)
     bpy.utils.register_class(POSE_OT_DeleteAllRotationKeys)
     bpy.utils.register_class(POSE_OT_DeleteAllScaleKeys)
+    bpy.utils.register_class(POSE_OT_DeleteChannelKeys)
+    bpy.utils.register_class(OBJECT_OT_DeleteChannelKeysAllActions)
     bpy.utils.register_class(POSE_OT_ScaleEachBoneModal)
     bpy.utils.register_class(POSE_OT_ScaleEachBoneApply)
+    bpy.types.Scene.bone_name_mapping = bpy.props.PointerProperty(
+        name="Bone mapping",
+        description="Text with one 'copied bone = target bone' line per bone, used when pasting onto a rig with other bone names",
+        type=bpy.types.Text,
+    )
+    bpy.types.Scene.bone_animation_only_selected = bpy.props.BoolProperty(
+        name="Selected bones only",
+        description="Copy and paste animation only for selected bones",
+        default=False,
+    )
+    bpy.types.Scene.bone_animation_use_location = bpy.props.BoolProperty(
+        name="Location",
+        description="Copy and paste location channels",
+        default=True,
+    )
+    bpy.types.Scene.bone_animation_use_rotation = bpy.props.BoolProperty(
+        name="Rotation",
+        description="Copy and paste rotation channels",
+        default=True,
+    )
+    bpy.types.Scene.bone_animation_use_scale = bpy.props.BoolProperty(
+        name="Scale",
+        description="Copy and paste scale channels",
+        default=True,
+    )
+    bpy.types.Scene.bone_animation_use_frame_range = bpy.props.BoolProperty(
+        name="Frame range",
+        description="Copy and paste only the keyed frames within the frame range",
+        default=False,
+    )
+    bpy.types.Scene.bone_animation_frame_start = bpy.props.IntProperty(
+        name="Start",
+        description="First frame copied or pasted",
+        default=1,
+    )
+    bpy.types.Scene.bone_animation_frame_end = bpy.props.IntProperty(
+        name="End",
+        description="Last frame copied or pasted",
+        default=250,
+    )
     bpy.types.Scene.bone_individual_scale = bpy.props.FloatProperty(
         name="Scale",
         description="Scale factor to apply to each selected bone",
@@ -802,21 +2096,39 @@ def unregister():
     addon_keymaps.clear()
 
     bpy.utils.unregister_class(OBJECT_OT_CopyArmatureConstraints)
+    bpy.utils.unregister_class(OBJECT_OT_CopyArmatureConstraintsToSelected)
     bpy.utils.unregister_class(OBJECT_OT_CopyBonePositionsRotations)
     bpy.utils.unregister_class(OBJECT_OT_PasteBonePositionsRotations)
     bpy.utils.unregister_class(OBJECT_OT_CopyBoneAnimationAllFrames)
+    bpy.utils.unregister_class(OBJECT_OT_ReduceCopiedBoneAnimation)
     bpy.utils.unregister_class(OBJECT_OT_PasteBoneAnimationAllFrames)
+    bpy.utils.unregister_class(OBJECT_OT_ExportBoneClipboard)
+    bpy.utils.unregister_class(OBJECT_OT_ImportBoneClipboard)
     bpy.utils.unregister_class(OBJECT_PT_armature_utilities)
     bpy.utils.unregister_class(OBJECT_PT_bone_utilities)
     bpy.utils.unregister_class(POSE_OT_MarkStartPose)
     bpy.utils.unregister_class(POSE_OT_CopyDelta)
     bpy.utils.unregister_class(POSE_OT_PasteDelta)
+    bpy.utils.unregister_class(POSE_OT_PasteDeltaOnKeys)
     bpy.utils.unregister_class(POSE_OT_DeleteAllLocationKeys)
     bpy.utils.unregister_class(POSE_OT_DeleteAllRotationKeys)
     bpy.utils.unregister_class(POSE_OT_DeleteAllScaleKeys)
+    bpy.utils.unregister_class(POSE_OT_DeleteChannelKeys)
+    bpy.utils.unregister_class(OBJECT_OT_DeleteChannelKeysAllActions)
     bpy.utils.unregister_class(POSE_OT_ScaleEachBoneModal)
     bpy.utils.unregister_class(POSE_OT_ScaleEachBoneApply)
+    del bpy.types.Scene.bone_name_mapping
+    del bpy.types.Scene.bone_animation_only_selected
+    del bpy.types.Scene.bone_animation_use_location
+    del bpy.types.Scene.bone_animation_use_rotation
+    del bpy.types.Scene.bone_animation_use_scale
+    del bpy.types.Scene.bone_animation_use_frame_range
+    del bpy.types.Scene.bone_animation_frame_start
+    del bpy.types.Scene.bone_animation_frame_end
     del bpy.types.Scene.bone_individual_scale
+    _bone_name_index_cache.clear()
+    _fcurve_index_cache.clear()
+    _rna_schema_cache.clear()
 
 if __name__ == "__main__":
     register()
@@ -29,7 +29,13 @@ import bpy
 import bmesh
 import math
 import re
-import copy
+import os
+import hashlib
+import time
+import concurrent.futures
+import itertools
+import numpy as np
+from collections import Counter, deque
 from datetime import datetime
 from mathutils.kdtree import KDTree
 
@@ -84,19 +90,55 @@ def showMessageBox(title = "Message Box", icon = 'INFO', lines=""):
 
 # -----------------------------------------------------------------------------
 
-def printToString(targetString, text, no_newline=False):
+class DiffReport:
+    popup_max_lines = 40
 
-    temp = targetString.split("\n")
-    if len(temp) > 0:
-        if len(temp[-1]) > 200:
-            targetString += ("\n")
+    def __init__(self):
+        self._lines = []
+        self._current = []
+        self._current_length = 0
 
-    if (no_newline):
-        targetString += (text)
-    else:
-        targetString += (text + "\n")
+    def _newline(self):
+        self._lines.append("".join(self._current))
+        self._current.clear()
+        self._current_length = 0
+
+    # Appends text, wrapping when the current line is over 200 characters
+    def add(self, text, no_newline=False):
+        if self._current_length > 200:
+            self._newline()
+
+        parts = text.split("\n")
+        for i, part in enumerate(parts):
+            if i > 0:
+                self._newline()
+            self._current.append(part)
+            self._current_length += len(part)
+
+        if not no_newline:
+            self._newline()
+
+    def lines(self):
+        return self._lines + ["".join(self._current)]
 
-    return targetString
+    def toText(self, name):
+        text = bpy.data.texts.get(name)
+        if text is None:
+            text = bpy.data.texts.new(name)
+        text.clear()
+        text.write("\n".join(self.lines()))
+        return text
+
+    # Shows the report in a popup, large reports are written to a text datablock and truncated
+    def show(self, title="Message Box", text_name="Diff report"):
+        lines = self.lines()
+
+        if len(lines) > self.popup_max_lines:
+            text = self.toText(text_name)
+            lines = lines[:self.popup_max_lines]
+            lines.append("... " + str(len(self.lines()) - self.popup_max_lines) + " more line(s), full report in text '" + text.name + "'")
+
+        showMessageBox(title=title, lines=lines)
 
 # -----------------------------------------------------------------------------
 
@@ -111,31 +153,175 @@ def purgeAll(self, context):
 
 # -----------------------------------------------------------------------------
 
-def diffLines(targetString, sourceName, targetName, lines1, lines2):
-    temp = copy.deepcopy(lines1)
+def removeCommonLines(lines, common):
+    remaining = []
+    to_skip = dict(common)
+
+    for x in lines:
+        if to_skip.get(x, 0) > 0:
+            to_skip[x] -= 1
+        else:
+            remaining.append(x)
+
+    lines[:] = remaining
+
+# -----------------------------------------------------------------------------
+# Removes, in place, the lines found in both lists (as a multiset) in linear time
+
+def diffLines(report, sourceName, targetName, lines1, lines2):
+    common = Counter(lines1) & Counter(lines2)
 
-    for x in temp:
-        if x in lines2:
-            lines1.remove(x)
-            lines2.remove(x)
+    if common:
+        removeCommonLines(lines1, common)
+        removeCommonLines(lines2, common)
 
     if len(lines1) == 0 and len(lines2) == 0:
-        targetString = printToString(targetString, "No difference")
-        return targetString
+        report.add("No difference")
+        return
 
     if len(lines1) > 0:
-        targetString = printToString(targetString, "Only in " + sourceName + ":")
+        report.add("Only in " + sourceName + ":")
         for x in lines1:
-            targetString = printToString(targetString, x + " ", no_newline=True)
-        targetString = printToString(targetString, "")
+            report.add(x + " ", no_newline=True)
+        report.add("")
 
     if len(lines2) > 0:
-        targetString = printToString(targetString, "Only in " + targetName + ":")
+        report.add("Only in " + targetName + ":")
         for x in lines2:
-            targetString = printToString(targetString, x + " ", no_newline=True)
-        targetString = printToString(targetString, "")
+            report.add(x + " ", no_newline=True)
+        report.add("")
 
-    return targetString
+# -----------------------------------------------------------------------------
+# Pose bones and their constraints are readable in object mode, no mode switch needed
+# A target pointing to the owner object is written as <self> so that two rigs compare equal
+
+def getBoneConstraintLines(obj, details=False):
+    lines = []
+
+    if obj.type != 'ARMATURE' or obj.pose is None:
+        return lines
+
+    for b in obj.pose.bones:
+        for c in b.constraints:
+            line = b.name.strip() + ":" + c.name.strip()
+            if details:
+                target = getattr(c, "target", None)
+                if target is None:
+                    target_name = ""
+                elif target == obj:
+                    target_name = "<self>"
+                else:
+                    target_name = target.name
+                line += " type=" + c.type + " target=" + target_name + " subtarget=" + getattr(c, "subtarget", "")
+            lines.append(line)
+
+    return lines
+
+# -----------------------------------------------------------------------------
+# Constraint fingerprints: writable RNA properties of each constraint, serialized and hashed per bone
+# The property list of each RNA struct type is computed once and cached
+# armature_utilities holds a copy for its constraint copy, as add-ons cannot import each other
+
+_fingerprint_skip_props = {'rna_type', 'name', 'show_expanded', 'active', 'is_valid', 'is_override_data_editable'}
+_rna_schema_cache = {}
+
+def getRnaSchema(struct):
+    key = struct.bl_rna.identifier
+    schema = _rna_schema_cache.get(key)
+
+    if schema is None:
+        schema = tuple(
+            (prop.identifier, prop.type) for prop in struct.bl_rna.properties
+            if prop.identifier not in _fingerprint_skip_props and (prop.type == 'COLLECTION' or not prop.is_readonly)
+        )
+        _rna_schema_cache[key] = schema
+
+    return schema
+
+def serializeRnaValue(value, prop_type, owner):
+    if prop_type == 'POINTER':
+        if value is None:
+            return None
+        if value == owner:
+            return "<self>"
+        if isinstance(value, bpy.types.ID):
+            return value.name
+        return None
+    if prop_type == 'COLLECTION':
+        return tuple(serializeRnaStruct(item, owner) for item in value)
+    if isinstance(value, float):
+        return round(value, 6)
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(value))
+    try:
+        return tuple(serializeRnaValue(v, prop_type, owner) for v in value)
+    except TypeError:
+        return str(value)
+
+def serializeRnaStruct(struct, owner):
+    values = []
+    for identifier, prop_type in getRnaSchema(struct):
+        try:
+            values.append((identifier, serializeRnaValue(getattr(struct, identifier), prop_type, owner)))
+        except:
+            pass
+    return tuple(values)
+
+# Returns {bone name: (digest, [(constraint name, serialized properties)])}
+
+def getBoneConstraintFingerprints(obj):
+    fingerprints = {}
+
+    if obj.type != 'ARMATURE' or obj.pose is None:
+        return fingerprints
+
+    for b in obj.pose.bones:
+        if len(b.constraints) == 0:
+            continue
+        constraints = [(c.name, serializeRnaStruct(c, obj)) for c in b.constraints]
+        digest = hashlib.blake2b(repr(constraints).encode(), digest_size=8).hexdigest()
+        fingerprints[b.name] = (digest, constraints)
+
+    return fingerprints
+
+def getRigFingerprint(fingerprints):
+    return hashlib.blake2b(repr(sorted((name, f[0]) for name, f in fingerprints.items())).encode(), digest_size=8).hexdigest()
+
+# -----------------------------------------------------------------------------
+# Compares constraint values, only expanding the properties of bones whose fingerprints differ
+
+def diffBoneConstraintValues(report, source, target):
+    fingerprints1 = getBoneConstraintFingerprints(source)
+    fingerprints2 = getBoneConstraintFingerprints(target)
+
+    if getRigFingerprint(fingerprints1) == getRigFingerprint(fingerprints2):
+        report.add("No difference")
+        return
+
+    found = False
+    for bone_name in sorted(fingerprints1.keys() & fingerprints2.keys()):
+        digest1, constraints1 = fingerprints1[bone_name]
+        digest2, constraints2 = fingerprints2[bone_name]
+
+        if digest1 == digest2:
+            continue
+
+        values2 = dict(constraints2)
+        for constraint_name, props1 in constraints1:
+            props2 = values2.get(constraint_name)
+            if props2 is None:
+                continue
+            props2 = dict(props2)
+            for identifier, value1 in props1:
+                value2 = props2.get(identifier)
+                if value1 != value2:
+                    report.add(bone_name + ":" + constraint_name + "." + identifier + " = " + str(value1) + " / " + str(value2))
+                    found = True
+
+    if not found:
+        report.add("No difference in common constraints")
 
 # -----------------------------------------------------------------------------
 
@@ -143,7 +329,7 @@ def diffObjects(self, context):
     lineCount = 0
     diffCount = 0
     sameCount = 0
-    targetString = ""
+    report = DiffReport()
     lines1 = []
     lines2 = []
 
@@ -166,12 +352,12 @@ def diffObjects(self, context):
     if target is None:
         return {'CANCELLED'}
 
-    targetString = printToString(targetString, "")
-    targetString = printToString(targetString, "Diff " + source.name + " and " + target.name)
-    targetString = printToString(targetString, "")
+    report.add("")
+    report.add("Diff " + source.name + " and " + target.name)
+    report.add("")
 
     if len(source.keys()) > 1 and len(target.keys()) > 1:
-        targetString = printToString(targetString, "[ Custom property names ]")
+        report.add("[ Custom property names ]")
 
         for p in source.keys():
             lines1.append(p.strip())
@@ -180,9 +366,9 @@ def diffObjects(self, context):
 
         lines1.sort()
         lines2.sort()
-        targetString = diffLines(targetString, source.name, target.name, lines1, lines2)
+        diffLines(report, source.name, target.name, lines1, lines2)
 
-        targetString = printToString(targetString, "[ Custom property values ]")
+        report.add("[ Custom property values ]")
 
         for p in source.keys():
             lines1.append("" + p.strip() + "=" + str(source.get(p)))
@@ -191,11 +377,11 @@ def diffObjects(self, context):
 
         lines1.sort()
         lines2.sort()
-        targetString = diffLines(targetString, source.name, target.name, lines1, lines2)
+        diffLines(report, source.name, target.name, lines1, lines2)
 
     try:
-        targetString = printToString(targetString, "")
-        targetString = printToString(targetString, "[ Vertex groups ]")
+        report.add("")
+        report.add("[ Vertex groups ]")
 
         lines1.clear()
         lines2.clear()
@@ -207,14 +393,14 @@ def diffObjects(self, context):
 
         lines1.sort()
         lines2.sort()
-        targetString = diffLines(targetString, source.name, target.name, lines1, lines2)
+        diffLines(report, source.name, target.name, lines1, lines2)
 
     except:
         pass
 
     try:
-        targetString = printToString(targetString, "")
-        targetString = printToString(targetString, "[ Vertex colors ]")
+        report.add("")
+        report.add("[ Vertex colors ]")
 
         lines1.clear()
         lines2.clear()
@@ -226,14 +412,14 @@ def diffObjects(self, context):
 
         lines1.sort()
         lines2.sort()
-        targetString = diffLines(targetString, source.name, target.name, lines1, lines2)
+        diffLines(report, source.name, target.name, lines1, lines2)
 
     except:
         pass
 
     try:
-        targetString = printToString(targetString, "")
-        targetString = printToString(targetString, "[ Modifiers ]")
+        report.add("")
+        report.add("[ Modifiers ]")
 
         lines1.clear()
         lines2.clear()
@@ -245,7 +431,7 @@ def diffObjects(self, context):
 
         lines1.sort()
         lines2.sort()
-        targetString = diffLines(targetString, source.name, target.name, lines1, lines2)
+        diffLines(report, source.name, target.name, lines1, lines2)
 
     except:
         pass
@@ -254,31 +440,109 @@ def diffObjects(self, context):
         objectType = getattr(source, 'type', '')
 
         if objectType in ['ARMATURE']:
-            targetString = printToString(targetString, "")
-            targetString = printToString(targetString, "[ Bone constraints ]")
-            bpy.ops.object.mode_set(mode='POSE')
+            report.add("")
+            report.add("[ Bone constraints ]")
 
-            lines1.clear()
-            lines2.clear()
+            lines1 = getBoneConstraintLines(source)
+            lines2 = getBoneConstraintLines(target)
 
-            for b in source.pose.bones:
-                for c in b.constraints:
-                    lines1.append(b.name.strip() + ":" + c.name.strip())
-            for b in target.pose.bones:
-                for c in b.constraints:
-                    lines2.append(b.name.strip() + ":" + c.name.strip())
+            lines1.sort()
+            lines2.sort()
+            diffLines(report, source.name, target.name, lines1, lines2)
+
+            report.add("")
+            report.add("[ Bone constraint details ]")
 
-            bpy.ops.object.mode_set(mode='OBJECT')
+            lines1 = getBoneConstraintLines(source, details=True)
+            lines2 = getBoneConstraintLines(target, details=True)
 
             lines1.sort()
             lines2.sort()
-            targetString = diffLines(targetString, source.name, target.name, lines1, lines2)
+            diffLines(report, source.name, target.name, lines1, lines2)
+
+            report.add("")
+            report.add("[ Bone constraint values ]")
+            diffBoneConstraintValues(report, source, target)
 
     except:
         pass
 
-    showMessageBox(lines=targetString.split("\n"))
+    report.show(title="Diff", text_name="Diff " + source.name + " " + target.name)
+
+    return {'FINISHED'}
+
+# -----------------------------------------------------------------------------
+# Categories compared by the batch diff, with their short column titles
+
+_diff_categories = (
+    ("properties", "Props"),
+    ("values", "Values"),
+    ("vertex_groups", "VGroups"),
+    ("vertex_colors", "VColors"),
+    ("modifiers", "Mods"),
+    ("bone_constraints", "Constr"),
+)
+
+def getObjectSignature(obj):
+    signature = {
+        "properties": Counter(p.strip() for p in obj.keys()),
+        "values": Counter(p.strip() + "=" + str(obj.get(p)) for p in obj.keys()),
+        "vertex_groups": Counter(g.name.strip() for g in obj.vertex_groups),
+        "vertex_colors": Counter(),
+        "modifiers": Counter(m.name.strip() for m in obj.modifiers),
+        "bone_constraints": Counter(),
+    }
+
+    if obj.type == 'MESH':
+        signature["vertex_colors"] = Counter(v.strip() for v in obj.data.vertex_colors.keys())
+
+    signature["bone_constraints"] = Counter(getBoneConstraintLines(obj, details=True))
+
+    return signature
+
+# -----------------------------------------------------------------------------
+
+def countSignatureDifferences(signature1, signature2):
+    counts = {}
+    for category, _ in _diff_categories:
+        lines1 = signature1[category]
+        lines2 = signature2[category]
+        counts[category] = sum((lines1 - lines2).values()) + sum((lines2 - lines1).values())
+    return counts
+
+# -----------------------------------------------------------------------------
+
+def diffObjectsBatch(self, context):
+    source = context.active_object
+
+    if source is None:
+        return {'CANCELLED'}
+
+    targets = [obj for obj in context.selected_objects if obj != source]
+
+    if len(targets) == 0:
+        self.report({'WARNING'}, "Select the objects to compare with the active object")
+        return {'CANCELLED'}
+
+    source_signature = getObjectSignature(source)
+
+    name_width = max(len("Object"), max(len(obj.name) for obj in targets))
+    report = DiffReport()
+    report.add("Diff " + source.name + " against " + str(len(targets)) + " object(s)")
+    report.add("")
+    report.add("Object".ljust(name_width) + "".join(f" {title:>8}" for _, title in _diff_categories) + f" {'Total':>8}")
+
+    differing = 0
+    for obj in sorted(targets, key=lambda o: o.name):
+        counts = countSignatureDifferences(source_signature, getObjectSignature(obj))
+        total = sum(counts.values())
+        if total > 0:
+            differing += 1
+        report.add(obj.name.ljust(name_width) + "".join(f" {counts[category]:>8}" for category, _ in _diff_categories) + f" {total:>8}")
+
+    report.show(title="Batch diff", text_name="Batch diff " + source.name)
 
+    self.report({'INFO'}, str(differing) + " of " + str(len(targets)) + " object(s) differ from " + source.name)
     return {'FINISHED'}
 
 # -----------------------------------------------------------------------------
@@ -415,31 +679,131 @@ def makeAllPropertiesOverridable(self, context):
 
 # -----------------------------------------------------------------------------
 
-def removeEmptyVertexGroups(self, context):
-    for obj in context.selected_objects:
+def findUnusedVertexGroupsLegacy(obj):
+    vgroup_used = {i: False for i, k in enumerate(obj.vertex_groups)}
+    vgroup_names = {i: k.name for i, k in enumerate(obj.vertex_groups)}
+    vgroup_name_list = list(vgroup_names.values())
 
-        obj.update_from_editmode()
+    for v in obj.data.vertices:
+        for g in v.groups:
 
-        vgroup_used = {i: False for i, k in enumerate(obj.vertex_groups)}
-        vgroup_names = {i: k.name for i, k in enumerate(obj.vertex_groups)}
-        vgroup_name_list = list(vgroup_names.values())
+            mirrored_name = getMirroredName(vgroup_names[g.group])
 
-        for v in obj.data.vertices:
-            for g in v.groups:
+            if mirrored_name in vgroup_name_list:
+                vgroup_used[g.group] = vgroup_used[vgroup_name_list.index(mirrored_name)]
+            else:
+                if g.weight > 0.01:
+                    vgroup_used[g.group] = True
 
-                mirrored_name = getMirroredName(vgroup_names[g.group])
+    return [i for i, used in sorted(vgroup_used.items()) if not used]
 
-                if mirrored_name in vgroup_name_list:
-                    vgroup_used[g.group] = vgroup_used[vgroup_name_list.index(mirrored_name)]
-                else:
-                    if g.weight > 0.01:
-                        vgroup_used[g.group] = True
+# -----------------------------------------------------------------------------
+# Reads every (group, weight) pair of the mesh in vertex order into flat arrays
+# Blender does not expose deform weights to foreach_get, the BMesh deform layer is the cheapest bulk path
+
+# Yields the (group indices, weights) of the vertices, chunk_size vertices at a time and in
+# vertex order, so that long meshes can be read over several time slices
+
+def iterVertexGroupWeightChunks(obj, chunk_size=4096):
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(obj.data)
+        deform_layer = bm.verts.layers.deform.active
+        if deform_layer is None:
+            return
+
+        verts = iter(bm.verts)
+        while True:
+            chunk = list(itertools.islice(verts, chunk_size))
+            if len(chunk) == 0:
+                return
+            entries = [item for v in chunk for item in v[deform_layer].items()]
+            if len(entries) > 0:
+                data = np.array(entries, dtype=np.float64)
+                yield data[:, 0].astype(np.int32), data[:, 1].astype(np.float32)
+    finally:
+        bm.free()
+
+def concatenateVertexGroupWeights(chunks):
+    if len(chunks) == 0:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+    return np.concatenate([c[0] for c in chunks]), np.concatenate([c[1] for c in chunks])
+
+def snapshotVertexGroupWeights(obj):
+    names = [g.name for g in obj.vertex_groups]
+    return (names, *concatenateVertexGroupWeights(list(iterVertexGroupWeightChunks(obj))))
+
+# -----------------------------------------------------------------------------
+
+def findUnusedVertexGroups(names, groups, weights):
+    group_count = len(names)
+    max_weights = np.zeros(group_count, dtype=np.float32)
+
+    valid = (groups >= 0) & (groups < group_count)
+    groups = groups[valid]
+    weights = weights[valid]
+
+    if len(groups) > 0:
+        order = np.argsort(groups, kind='stable')
+        sorted_groups = groups[order]
+        starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+        max_weights[sorted_groups[starts]] = np.maximum.reduceat(weights[order], starts)
+
+    used = max_weights > 0.01
+
+    name_to_index = {name: i for i, name in enumerate(names)}
+    mirror_index = [name_to_index.get(getMirroredName(name), -1) for name in names]
+
+    # A group whose mirrored counterpart exists copies the counterpart's state while vertices
+    # are visited, so it can only become used through a chain that ends on an unmirrored group
+    chained = set()
+    for i, m in enumerate(mirror_index):
+        if m < 0:
+            continue
+        used[i] = False
+        chain = [i]
+        j = m
+        while j >= 0 and j not in chain:
+            chain.append(j)
+            j = mirror_index[j]
+        if j < 0:
+            chained.update(chain)
+
+    if chained:
+        state = {i: False for i in chained}
+        mask = np.isin(groups, list(chained))
+        for group, weight in zip(groups[mask].tolist(), weights[mask].tolist()):
+            if mirror_index[group] >= 0:
+                state[group] = state[mirror_index[group]]
+            elif weight > 0.01:
+                state[group] = True
+        for i in chained:
+            if mirror_index[i] >= 0:
+                used[i] = state[i]
+
+    return np.flatnonzero(~used).tolist()
+
+def findUnusedVertexGroupNames(names, groups, weights):
+    return [names[i] for i in findUnusedVertexGroups(names, groups, weights)]
 
-        for i, used in sorted(vgroup_used.items(), reverse=True):
-            if not used:
-                obj.vertex_groups.remove(obj.vertex_groups[i])
+# -----------------------------------------------------------------------------
+
+def removeEmptyVertexGroups(self, context, use_numpy=True):
+    for obj in context.selected_objects:
+        if obj.type != 'MESH':
+            continue
+
+        obj.update_from_editmode()
+
+        if use_numpy:
+            unused = findUnusedVertexGroups(*snapshotVertexGroupWeights(obj))
+        else:
+            unused = findUnusedVertexGroupsLegacy(obj)
 
-        self.report({'INFO'}, "Removed empty groups from " + obj.name)
+        for i in sorted(unused, reverse=True):
+            obj.vertex_groups.remove(obj.vertex_groups[i])
+
+        self.report({'INFO'}, "Removed " + str(len(unused)) + " empty group(s) from " + obj.name)
 
     return {'FINISHED'}
 
@@ -457,8 +821,119 @@ def removeAllModifiers(self, context):
 
 # -----------------------------------------------------------------------------
 
+# Modifier stack fingerprint: hash of the mesh data pointer, vertex group names, and the type,
+# settings and ID references of each modifier. Objects with the same fingerprint get the same
+# modifier result within one run. A stack pointing to objects (directly, through a collection
+# or UV projectors) or using global or object texture coordinates depends on where things are,
+# so it has no fingerprint (None). Neither has a stack with Geometry Nodes, whose trees can
+# read the object itself (Object Info, Self Object)
+
+def getModifierReferences(mod):
+    references = []
+
+    for identifier in getModifierSchema(mod)["pointers"]:
+        try:
+            value = getattr(mod, identifier)
+        except AttributeError:
+            continue
+        if isinstance(value, (bpy.types.Object, bpy.types.Collection)):
+            return None
+        if isinstance(value, bpy.types.ID):
+            references.append((identifier, value.as_pointer()))
+
+    try:
+        mod_keys = mod.keys()
+    except TypeError:
+        mod_keys = []
+    for key in mod_keys:
+        value = mod[key]
+        if isinstance(value, (bpy.types.Object, bpy.types.Collection)):
+            return None
+        if isinstance(value, bpy.types.ID):
+            references.append((key, value.as_pointer()))
+
+    return references
+
+def isModifierPlacementDependent(mod):
+    if mod.type == 'NODES':
+        return True
+    if getattr(mod, 'texture_coords', None) == 'GLOBAL':
+        return True
+    if getattr(mod, 'mask_tex_mapping', None) in {'GLOBAL', 'OBJECT'}:
+        return True
+    return len(getattr(mod, 'projectors', ())) > 0
+
+def getModifierStackFingerprint(obj):
+    parts = [obj.data.as_pointer(), [vg.name for vg in obj.vertex_groups]]
+
+    for mod in obj.modifiers:
+        if isModifierPlacementDependent(mod):
+            return None
+        references = getModifierReferences(mod)
+        if references is None:
+            return None
+        inputs = {key: entry["value"] for key, entry in getModifierInputParams(mod).items()}
+        parts.append((mod.type, sorted(getModifierParams(mod).items()), references, sorted(inputs.items())))
+
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+def bakeObjectToMesh(obj, depsgraph):
+    return bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph)
+
+# Replaces a non-mesh object by a mesh object with the same name, parenting, transform,
+# constraints, animation, custom properties, visibility, object materials and users
+
+_converted_object_props = (
+    'parent', 'parent_type', 'parent_bone', 'parent_vertices', 'matrix_basis',
+    'hide_viewport', 'hide_render', 'hide_select', 'display_type', 'show_wire', 'show_in_front',
+    'visible_camera', 'visible_diffuse', 'visible_glossy', 'visible_transmission',
+    'visible_volume_scatter', 'visible_shadow', 'is_shadow_catcher', 'is_holdout', 'pass_index', 'color'
+)
+
+def replaceWithMeshObject(obj, mesh):
+    name = obj.name
+    obj.name = name + ".converted"
+    mesh_obj = bpy.data.objects.new(name, mesh)
+
+    for identifier in _converted_object_props:
+        try:
+            setattr(mesh_obj, identifier, getattr(obj, identifier))
+        except (AttributeError, TypeError, ValueError):
+            pass
+    mesh_obj.matrix_parent_inverse = obj.matrix_parent_inverse.copy()
+
+    for constraint in obj.constraints:
+        mesh_obj.constraints.copy(constraint)
+
+    if obj.animation_data is not None:
+        animation_data = mesh_obj.animation_data_create()
+        animation_data.action = obj.animation_data.action
+        for driver in obj.animation_data.drivers:
+            animation_data.drivers.from_existing(src_driver=driver)
+
+    for key in obj.keys():
+        value = obj[key]
+        if hasattr(value, "to_dict"):
+            value = value.to_dict()
+        elif hasattr(value, "to_list"):
+            value = value.to_list()
+        mesh_obj[key] = value
+
+    for index, slot in enumerate(obj.material_slots):
+        if slot.link == 'OBJECT' and index < len(mesh_obj.material_slots):
+            mesh_obj.material_slots[index].link = 'OBJECT'
+            mesh_obj.material_slots[index].material = slot.material
+
+    hidden = obj.hide_get()
+    obj.user_remap(mesh_obj)
+    bpy.data.objects.remove(obj)
+    mesh_obj.hide_set(hidden)
+    mesh_obj.select_set(True)
+    return mesh_obj
+
 def cleanAndApplyModifiers(self, context):
     simulation_types = {'COLLISION', 'FLUID', 'PARTICLE_SYSTEM', 'CLOTH', 'SOFT_BODY', 'DYNAMIC_PAINT', 'EXPLODE', 'OCEAN', 'SURFACE'}
+    convertible_types = {'CURVE', 'SURFACE', 'FONT', 'META'}
 
     for obj in context.selected_objects:
         for mod in list(obj.modifiers):
@@ -475,19 +950,26 @@ def cleanAndApplyModifiers(self, context):
         bpy.ops.object.mode_set(mode='OBJECT')
 
     original_active = context.view_layer.objects.active
-    original_selected = list(context.selected_objects)
-    depsgraph = context.evaluated_depsgraph_get()
 
-    for obj in original_selected:
+    # Group objects sharing the same result, within this run only
+    groups = {}
+    converted = []
+    others = []
+    for obj in context.selected_objects:
         if len(obj.modifiers) == 0:
             continue
-
         if obj.type == 'MESH':
-            obj_eval = obj.evaluated_get(depsgraph)
-            mesh = bpy.data.meshes.new_from_object(obj_eval, preserve_all_data_layers=True, depsgraph=depsgraph)
-            obj.data = mesh
-            obj.modifiers.clear()
+            fingerprint = getModifierStackFingerprint(obj)
+            groups.setdefault(fingerprint if fingerprint is not None else obj.as_pointer(), []).append(obj)
+        elif obj.type in convertible_types:
+            converted.append(obj)
         else:
+            others.append(obj)
+
+    # Objects that stay what they are (lattices...) apply their modifiers one by one
+    if others:
+        original_selected = list(context.selected_objects)
+        for obj in others:
             bpy.ops.object.select_all(action='DESELECT')
             obj.select_set(True)
             context.view_layer.objects.active = obj
@@ -501,14 +983,36 @@ def cleanAndApplyModifiers(self, context):
                     except:
                         pass
 
-    bpy.ops.object.select_all(action='DESELECT')
-    for o in original_selected:
-        if o.name in bpy.data.objects:
-            o.select_set(True)
-    if original_active and original_active.name in bpy.data.objects:
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in original_selected:
+            obj.select_set(True)
         context.view_layer.objects.active = original_active
 
-    self.report({'INFO'}, "Cleaned and applied modifiers")
+    depsgraph = context.evaluated_depsgraph_get()
+    old_data = set()
+
+    for objects in groups.values():
+        mesh = bakeObjectToMesh(objects[0], depsgraph)
+        for obj in objects:
+            old_data.add(obj.data)
+            obj.data = mesh
+            obj.modifiers.clear()
+
+    for obj in converted:
+        old_data.add(obj.data)
+        was_active = obj == original_active
+        mesh_obj = replaceWithMeshObject(obj, bakeObjectToMesh(obj, depsgraph))
+        if was_active:
+            context.view_layer.objects.active = mesh_obj
+
+    orphans = [data for data in old_data if data.users == 0]
+    bpy.data.batch_remove(orphans)
+
+    applied = sum(len(objects) for objects in groups.values())
+    message = f"Applied modifiers on {applied} mesh(es) with {len(groups)} evaluation(s), converted {len(converted)} object(s), freed {len(orphans)} orphan datablock(s)"
+    if others:
+        message += f", applied modifiers on {len(others)} other object(s)"
+    self.report({'INFO'}, message)
     return {'FINISHED'}
 
 def toggleShadowCatcher(self, context):
@@ -573,6 +1077,73 @@ def _sanitize_value(value):
         return [_sanitize_value(v) for v in value]
     return str(value)
 
+# Per modifier type: identifiers of the writable plain properties ("params", also as a set in
+# "param_set") and of the pointer properties ("pointers"). Built once per type; the cache is
+# module level, so reloading the add-on starts a new one
+
+_modifier_schema_cache = {}
+
+def getModifierSchema(mod):
+    key = mod.bl_rna.identifier
+    schema = _modifier_schema_cache.get(key)
+
+    if schema is None:
+        safe_types = {'BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM', 'BOOLEAN_ARRAY', 'INT_ARRAY', 'FLOAT_ARRAY'}
+        skip_props = {'name', 'type', 'rna_type', 'show_viewport', 'show_render', 'show_in_editmode', 'show_on_cage', 'show_expanded', 'is_active'}
+        params = tuple(
+            prop.identifier for prop in mod.bl_rna.properties
+            if prop.identifier not in skip_props and not prop.is_readonly and prop.type in safe_types
+        )
+        schema = {
+            "params": params,
+            "param_set": frozenset(params),
+            "pointers": tuple(prop.identifier for prop in mod.bl_rna.properties if prop.type == 'POINTER'),
+        }
+        _modifier_schema_cache[key] = schema
+
+    return schema
+
+# Settings of a modifier: its writable plain properties, and its custom (node group input) properties
+
+def getModifierParams(mod):
+    params = {}
+    for identifier in getModifierSchema(mod)["params"]:
+        try:
+            value = getattr(mod, identifier)
+            if hasattr(value, '__iter__') and not isinstance(value, (str, bytes)):
+                value = list(value)
+            params[identifier] = value
+        except:
+            pass
+    return params
+
+def getModifierInputParams(mod):
+    input_params = {}
+    try:
+        mod_keys = mod.keys()
+    except TypeError:
+        mod_keys = []
+    try:
+        rna_ui = mod.get("_RNA_UI")
+    except TypeError:
+        rna_ui = None
+    for key in mod_keys:
+        if key == '_RNA_UI':
+            continue
+        try:
+            val = mod[key]
+            sanitized = _sanitize_value(val)
+            is_overridable = mod.is_property_overridable_library(f'["{key}"]')
+            entry = {"value": sanitized, "is_overridable": is_overridable}
+            if rna_ui and key in rna_ui:
+                entry["rna_ui"] = _sanitize_value(rna_ui[key])
+            input_params[key] = entry
+        except:
+            pass
+    return input_params
+
+# -----------------------------------------------------------------------------
+
 def copyModifierParams(self, context):
     global _copied_modifier_data
     obj = context.active_object
@@ -590,49 +1161,11 @@ def copyModifierParams(self, context):
     for mod in obj.modifiers:
         if mod.type in skip_modifier_types:
             continue
-        safe_types = {'BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM', 'BOOLEAN_ARRAY', 'INT_ARRAY', 'FLOAT_ARRAY'}
-        params = {}
-        for prop in mod.bl_rna.properties:
-            if prop.identifier in ('name', 'type', 'rna_type', 'show_viewport', 'show_render', 'show_in_editmode', 'show_on_cage', 'show_expanded', 'is_active'):
-                continue
-            if prop.is_readonly:
-                continue
-            if prop.type not in safe_types:
-                continue
-            try:
-                value = getattr(mod, prop.identifier)
-                if hasattr(value, '__iter__') and not isinstance(value, (str, bytes)):
-                    value = list(value)
-                params[prop.identifier] = value
-            except:
-                pass
-        input_params = {}
-        try:
-            mod_keys = mod.keys()
-        except TypeError:
-            mod_keys = []
-        try:
-            rna_ui = mod.get("_RNA_UI")
-        except TypeError:
-            rna_ui = None
-        for key in mod_keys:
-            if key == '_RNA_UI':
-                continue
-            try:
-                val = mod[key]
-                sanitized = _sanitize_value(val)
-                is_overridable = mod.is_property_overridable_library(f'["{key}"]')
-                entry = {"value": sanitized, "is_overridable": is_overridable}
-                if rna_ui and key in rna_ui:
-                    entry["rna_ui"] = _sanitize_value(rna_ui[key])
-                input_params[key] = entry
-            except:
-                pass
         modifier_data.append({
             "name": mod.name,
             "type": mod.type,
-            "params": params,
-            "input_params": input_params,
+            "params": getModifierParams(mod),
+            "input_params": getModifierInputParams(mod),
         })
 
     custom_props = []
@@ -697,13 +1230,9 @@ def pasteModifierParams(self, context):
 
         used_names.add(target_mod.name)
 
-        safe_types = {'BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM', 'BOOLEAN_ARRAY', 'INT_ARRAY', 'FLOAT_ARRAY'}
-        skip_props = {'show_viewport', 'show_render', 'show_in_editmode', 'show_on_cage', 'show_expanded', 'is_active'}
+        param_set = getModifierSchema(target_mod)["param_set"]
         for prop_name, prop_value in src_mod["params"].items():
-            if prop_name in skip_props:
-                continue
-            rna_prop = target_mod.bl_rna.properties.get(prop_name)
-            if rna_prop is None or rna_prop.type not in safe_types:
+            if prop_name not in param_set:
                 continue
             try:
                 setattr(target_mod, prop_name, prop_value)
@@ -750,33 +1279,76 @@ def replaceObjectInModifiers(self, context):
     count = 0
     for obj in bpy.data.objects:
         for mod in obj.modifiers:
-            for prop in mod.bl_rna.properties:
-                if prop.type == 'POINTER':
-                    try:
-                        val = getattr(mod, prop.identifier)
-                        if isinstance(val, bpy.types.Object) and val.name == source_name:
-                            setattr(mod, prop.identifier, target_obj)
-                            count += 1
-                    except:
-                        pass
+            for identifier in getModifierSchema(mod)["pointers"]:
+                try:
+                    val = getattr(mod, identifier)
+                    if isinstance(val, bpy.types.Object) and val.name == source_name:
+                        setattr(mod, identifier, target_obj)
+                        count += 1
+                except:
+                    pass
 
     self.report({'INFO'}, f"Replaced {count} reference(s)")
     return {'FINISHED'}
 
 # -----------------------------------------------------------------------------
 
+# FCurve index of an action: {(bone name, channel): [(data path, array index)]}, bone name
+# being None for curves that do not animate a pose bone (same index as in armature_utilities),
+# along with the data paths of each channel: {channel: {data path}}
+# Rebuilt when the action fcurve list changes
+
+_fcurve_index_cache = {}
+
+def parseFcurvePath(data_path):
+    if data_path.startswith('pose.bones["'):
+        end = data_path.find('"].', 12)
+        if end != -1:
+            return data_path[12:end], data_path[end + 3:]
+    return None, data_path.rsplit(".", 1)[-1]
+
+# The curve count and the last curve tell a changed curve list, as new curves are appended
+
+def getFcurveListStamp(action):
+    fcurves = action.fcurves
+    if len(fcurves) == 0:
+        return (0, None, 0)
+    return (len(fcurves), fcurves[-1].data_path, fcurves[-1].array_index)
+
+def getCachedFcurveIndex(action):
+    key = action.as_pointer()
+    stamp = getFcurveListStamp(action)
+    cached = _fcurve_index_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached
+
+    index = {}
+    channel_paths = {}
+    for fcurve in action.fcurves:
+        bone_channel = parseFcurvePath(fcurve.data_path)
+        index.setdefault(bone_channel, []).append((fcurve.data_path, fcurve.array_index))
+        channel_paths.setdefault(bone_channel[1], set()).add(fcurve.data_path)
+
+    cached = [stamp, index, channel_paths]
+    _fcurve_index_cache[key] = cached
+    return cached
+
+def getActionChannelPaths(action, channel):
+    return getCachedFcurveIndex(action)[2].get(channel, set())
+
+# -----------------------------------------------------------------------------
+
 def removeKeyframesByChannel(self, context, channel):
     for obj in context.selected_objects:
 
         if obj.animation_data:
             action = obj.animation_data.action
             if action:
-                for fc in action.fcurves:
-                    if fc.data_path.endswith(channel):
-                        try:
-                            obj.keyframe_delete(fc.data_path)
-                        except TypeError:
-                            print(fc.data_path + " channel does not exist. Ignoring.")
+                for data_path in list(getActionChannelPaths(action, channel)):
+                    try:
+                        obj.keyframe_delete(data_path)
+                    except TypeError:
+                        print(data_path + " channel does not exist. Ignoring.")
 
         self.report({'INFO'}, "Removed " + channel + " type keyframes from " + obj.name)
 
@@ -954,7 +1526,7 @@ def rotateFaceVertexIndices(context):
 
 # -----------------------------------------------------------------------------
 
-def selectMergeByDistanceVerts(self, context, threshold):
+def selectMergeByDistanceVertsLegacy(self, context, threshold):
     obj = context.active_object
     if obj is None or obj.type != 'MESH':
         self.report({'ERROR'}, "Active object is not a mesh")
@@ -1000,6 +1572,253 @@ def selectMergeByDistanceVerts(self, context, threshold):
 
     return {'FINISHED'}
 
+# -----------------------------------------------------------------------------
+# Uniform grid of vertex coordinates with a cell size of at least the threshold
+# Yields (i, j) index arrays of vertex pairs within the threshold, each pair once
+# Distances are computed in float32 like mathutils.kdtree
+
+_spatial_hash_primes = (np.int64(73856093), np.int64(19349663), np.int64(83492791))
+_half_neighborhood = [(0, 0, 0)] + [
+    (dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+    if (dx, dy, dz) > (0, 0, 0)
+]
+
+def hashCells(cells):
+    return (cells[:, 0] * _spatial_hash_primes[0]) ^ (cells[:, 1] * _spatial_hash_primes[1]) ^ (cells[:, 2] * _spatial_hash_primes[2])
+
+def iterCloseVertexPairs(coords, threshold, chunk_size=1 << 22):
+    coords = np.ascontiguousarray(coords, dtype=np.float32)
+    count = len(coords)
+
+    if count < 2:
+        return
+
+    if threshold <= 0.0:
+        _, inverse = np.unique(coords, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        order = np.argsort(inverse, kind='stable')
+        same = inverse[order[1:]] == inverse[order[:-1]]
+        if np.any(same):
+            yield order[:-1][same], order[1:][same]
+        return
+
+    threshold_sq = np.float32(threshold) * np.float32(threshold)
+
+    cells = np.floor(coords.astype(np.float64) / (threshold * (1.0 + 1e-6))).astype(np.int64)
+    cells -= cells.min(axis=0)
+    dims = [int(d) for d in cells.max(axis=0) + 2]
+
+    # Linear cell keys keep neighbor lookups sorted (an offset is a constant key shift)
+    # Grids too large for int64 fall back to hashed keys, where collisions only add candidates
+    linear = dims[0] * dims[1] * dims[2] < (1 << 62)
+    if linear:
+        keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    else:
+        keys = hashCells(cells)
+
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    sorted_cells = None if linear else cells[order]
+
+    for offset in _half_neighborhood:
+        if linear:
+            neighbor_keys = sorted_keys + ((offset[0] * dims[1] + offset[1]) * dims[2] + offset[2])
+        else:
+            neighbor_keys = hashCells(sorted_cells + np.array(offset, dtype=np.int64))
+        starts = np.searchsorted(sorted_keys, neighbor_keys, side='left')
+        ends = np.searchsorted(sorted_keys, neighbor_keys, side='right')
+        counts = ends - starts
+
+        queries = np.flatnonzero(counts)
+        if queries.size == 0:
+            continue
+
+        query_counts = counts[queries]
+        cumulative = np.cumsum(query_counts)
+        bounds = np.searchsorted(cumulative, np.arange(chunk_size, cumulative[-1], chunk_size), side='left')
+
+        for first, last in zip(np.r_[0, bounds], np.r_[bounds, queries.size]):
+            if first >= last:
+                continue
+            chunk_counts = query_counts[first:last]
+            i = order[np.repeat(queries[first:last], chunk_counts)]
+            local = np.arange(len(i)) - np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+            j = order[np.repeat(starts[queries[first:last]], chunk_counts) + local]
+
+            keep = (j > i) if offset == (0, 0, 0) else (j != i)
+            i = i[keep]
+            j = j[keep]
+
+            d = coords[i] - coords[j]
+            close = d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1] + d[:, 2] * d[:, 2] <= threshold_sq
+            if np.any(close):
+                yield i[close], j[close]
+
+def findVerticesWithinDistance(coords, threshold):
+    selected = np.zeros(len(coords), dtype=bool)
+
+    for i, j in iterCloseVertexPairs(coords, threshold):
+        selected[i] = True
+        selected[j] = True
+
+    return selected
+
+# -----------------------------------------------------------------------------
+
+def selectMergeByDistanceVerts(self, context, threshold, use_numpy=True):
+    if not use_numpy:
+        return selectMergeByDistanceVertsLegacy(self, context, threshold)
+
+    obj = context.active_object
+    if obj is None or obj.type != 'MESH':
+        self.report({'ERROR'}, "Active object is not a mesh")
+        return {'CANCELLED'}
+
+    me = obj.data
+
+    # Vertex arrays are only up to date outside of edit mode
+    bpy.ops.object.mode_set(mode='OBJECT')
+    try:
+        vertex_count = len(me.vertices)
+        if vertex_count == 0:
+            self.report({'WARNING'}, "No vertices in mesh")
+            return {'CANCELLED'}
+
+        coords = np.empty(vertex_count * 3, dtype=np.float32)
+        me.vertices.foreach_get("co", coords)
+
+        selected = findVerticesWithinDistance(coords.reshape(-1, 3), threshold)
+        me.vertices.foreach_set("select", selected)
+    finally:
+        bpy.ops.object.mode_set(mode='EDIT')
+
+    count = int(np.count_nonzero(selected))
+    if count == 0:
+        self.report({'INFO'}, "No vertices to merge found")
+    else:
+        self.report({'INFO'}, f"Selected {count} vertice(s) that would be merged")
+
+    return {'FINISHED'}
+
+# -----------------------------------------------------------------------------
+# Close vertex pairs of the last analyzed mesh, found with a power of two cell size
+# Any threshold up to that cell size only filters the cached pairs, the grid is
+# rebuilt when the threshold crosses to another cell size, or the mesh or its vertices
+# change. Vertices are compared through a hash, so the cache only holds the pairs,
+# with 32 bit indices
+
+_merge_preview_cache = {}
+
+def getCachedClosePairs(mesh, coords, threshold):
+    if threshold <= 0.0:
+        pairs = list(iterCloseVertexPairs(coords, 0.0))
+        if len(pairs) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return np.concatenate([p[0] for p in pairs]), np.concatenate([p[1] for p in pairs])
+
+    cell_size = 2.0 ** math.ceil(math.log2(threshold))
+    cache = _merge_preview_cache
+
+    mesh_key = mesh.as_pointer()
+    coords_hash = hashlib.blake2b(coords.tobytes(), digest_size=16).digest()
+
+    if cache.get("mesh") != mesh_key or cache.get("cell_size") != cell_size or cache.get("coords_hash") != coords_hash:
+        cache.clear()
+        pairs = list(iterCloseVertexPairs(coords, cell_size))
+        i = np.concatenate([p[0] for p in pairs]) if pairs else np.zeros(0, dtype=np.int64)
+        j = np.concatenate([p[1] for p in pairs]) if pairs else np.zeros(0, dtype=np.int64)
+        d = coords[i] - coords[j]
+        dist_sq = d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1] + d[:, 2] * d[:, 2]
+        order = np.argsort(dist_sq, kind='stable')
+
+        cache["mesh"] = mesh_key
+        cache["coords_hash"] = coords_hash
+        cache["cell_size"] = cell_size
+        cache["i"] = i[order].astype(np.int32)
+        cache["j"] = j[order].astype(np.int32)
+        cache["dist_sq"] = dist_sq[order]
+
+    end = np.searchsorted(cache["dist_sq"], np.float32(threshold) * np.float32(threshold), side='right')
+    return cache["i"][:end], cache["j"][:end]
+
+# -----------------------------------------------------------------------------
+# Connected components of the pair graph, by hooking roots and pointer jumping
+# Returns the root (smallest vertex index) of each vertex's cluster
+
+def getVertexClusterRoots(count, i, j):
+    labels = np.arange(count)
+
+    while len(i) > 0:
+        li = labels[i]
+        lj = labels[j]
+        differ = li != lj
+        if not np.any(differ):
+            break
+
+        targets = np.concatenate((li[differ], lj[differ]))
+        low = np.minimum(li[differ], lj[differ])
+        values = np.concatenate((low, low))
+        order = np.argsort(targets, kind='stable')
+        targets = targets[order]
+        starts = np.flatnonzero(np.r_[True, targets[1:] != targets[:-1]])
+        roots = targets[starts]
+        labels[roots] = np.minimum(labels[roots], np.minimum.reduceat(values[order], starts))
+
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+    return labels
+
+# -----------------------------------------------------------------------------
+
+def analyzeMergeByDistance(self, context, threshold):
+    obj = context.active_object
+    if obj is None or obj.type != 'MESH':
+        self.report({'ERROR'}, "Active object is not a mesh")
+        return {'CANCELLED'}
+
+    me = obj.data
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    try:
+        vertex_count = len(me.vertices)
+        if vertex_count == 0:
+            self.report({'WARNING'}, "No vertices in mesh")
+            return {'CANCELLED'}
+
+        coords = np.empty(vertex_count * 3, dtype=np.float32)
+        me.vertices.foreach_get("co", coords)
+        coords = coords.reshape(-1, 3)
+
+        roots = getVertexClusterRoots(vertex_count, *getCachedClosePairs(me, coords, threshold))
+        sizes = np.bincount(roots, minlength=vertex_count)
+
+        clustered = sizes[roots] > 1
+        cluster_ids = np.full(vertex_count, -1, dtype=np.int32)
+        if np.any(clustered):
+            _, inverse = np.unique(roots[clustered], return_inverse=True)
+            cluster_ids[clustered] = inverse.ravel()
+
+        attribute = me.attributes.get("merge_cluster")
+        if attribute is not None and (attribute.data_type != 'INT' or attribute.domain != 'POINT'):
+            me.attributes.remove(attribute)
+            attribute = None
+        if attribute is None:
+            attribute = me.attributes.new("merge_cluster", 'INT', 'POINT')
+        attribute.data.foreach_set("value", cluster_ids)
+    finally:
+        bpy.ops.object.mode_set(mode='EDIT')
+
+    cluster_count = int(cluster_ids.max()) + 1
+    largest = int(sizes.max()) if cluster_count > 0 else 0
+    result_count = int(np.count_nonzero(roots == np.arange(vertex_count)))
+
+    self.report({'INFO'}, f"{cluster_count} cluster(s), largest has {largest} vertice(s), {vertex_count} -> {result_count} vertice(s) after merge")
+    return {'FINISHED'}
+
 # -----------------------------------------------------------------------------
 # Operators
 
@@ -1053,6 +1872,16 @@ class OBJECT_OT_DiffObjectData(bpy.types.Operator):
     def execute(self, context):
         return diffObjects(self, context)
 
+class OBJECT_OT_DiffObjectDataBatch(bpy.types.Operator):
+    """Diff Object Data (batch)"""
+    bl_idname = "object.diff_object_data_batch"
+    bl_label = "Diff object data (batch)"
+    bl_description = "Compares all selected objects with the active object and shows a count of differences per category"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        return diffObjectsBatch(self, context)
+
 class OBJECT_OT_SyncObjectProperties(bpy.types.Operator):
     """Sync Object Properties"""
     bl_idname = "object.sync_object_properties"
@@ -1100,8 +1929,132 @@ class OBJECT_OT_RemoveEmptyVertexGroups(bpy.types.Operator):
     bl_description = "Removes empty vertex groups"
     bl_options = {'REGISTER'}
 
+    use_numpy: bpy.props.BoolProperty(
+        name="Use NumPy",
+        description="Read all vertex weights in bulk and reduce them with NumPy instead of walking each vertex",
+        default=True,
+    )
+
     def execute(self, context):
-        return removeEmptyVertexGroups(self, context)
+        return removeEmptyVertexGroups(self, context, self.use_numpy)
+
+class OBJECT_OT_RemoveEmptyVertexGroupsBatch(bpy.types.Operator):
+    """Remove Empty Vertex Groups (batch)"""
+    bl_idname = "object.remove_empty_vertex_groups_batch"
+    bl_label = "Remove empty vertex groups (batch)"
+    bl_description = "Removes empty vertex groups from all selected meshes, analyzing weights in background workers. Esc to cancel"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def invoke(self, context, event):
+        self._pending = deque(obj.name for obj in context.selected_objects if obj.type == 'MESH' and len(obj.vertex_groups) > 0)
+        self._total = len(self._pending)
+
+        if self._total == 0:
+            self.report({'WARNING'}, "No selected mesh with vertex groups")
+            return {'CANCELLED'}
+
+        self._done = 0
+        self._failed = 0
+        self._reading = None
+        self._futures = {}
+        self._unused = {}
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+        wm = context.window_manager
+        wm.progress_begin(0, self._total)
+        self._timer = wm.event_timer_add(0.05, window=context.window)
+        wm.modal_handler_add(self)
+        self._update_status(context, "")
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._finish(context)
+            self.report({'WARNING'}, f"Cancelled after analyzing {self._done} of {self._total} object(s), nothing removed")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        # Snapshots need bpy and stay on the main thread, read a chunk of vertices at a time
+        # within a short time slice per tick: (name, group names, chunk iterator, chunks)
+        current_name = self._reading[0] if self._reading else ""
+        start = time.perf_counter()
+        while (self._reading or self._pending) and time.perf_counter() - start < 0.05:
+            if self._reading is None:
+                current_name = self._pending.popleft()
+                obj = bpy.data.objects.get(current_name)
+                if obj is None or obj.type != 'MESH':
+                    self._done += 1
+                    continue
+                obj.update_from_editmode()
+                self._reading = (current_name, [g.name for g in obj.vertex_groups], iterVertexGroupWeightChunks(obj), [])
+
+            name, names, chunk_iterator, chunks = self._reading
+            chunk = next(chunk_iterator, None)
+            if chunk is not None:
+                chunks.append(chunk)
+                continue
+
+            self._reading = None
+            self._futures[name] = self._executor.submit(findUnusedVertexGroupNames, names, *concatenateVertexGroupWeights(chunks))
+
+        for name, future in list(self._futures.items()):
+            if future.done():
+                del self._futures[name]
+                self._done += 1
+                try:
+                    self._unused[name] = future.result()
+                except Exception as e:
+                    self._failed += 1
+                    self.report({'WARNING'}, f"Could not analyze {name}: {e}")
+
+        self._update_status(context, current_name)
+
+        if self._reading or self._pending or self._futures:
+            return {'RUNNING_MODAL'}
+
+        removed = self._apply()
+        self._finish(context)
+        message = f"Removed {removed} empty group(s) from {len(self._unused)} object(s)"
+        if self._failed > 0:
+            message += f", {self._failed} object(s) could not be analyzed"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+    def cancel(self, context):
+        self._finish(context)
+
+    def _apply(self):
+        removed = 0
+        for name, group_names in self._unused.items():
+            obj = bpy.data.objects.get(name)
+            if obj is None:
+                continue
+            for group_name in group_names:
+                vg = obj.vertex_groups.get(group_name)
+                if vg is not None:
+                    obj.vertex_groups.remove(vg)
+                    removed += 1
+        return removed
+
+    def _update_status(self, context, current_name):
+        context.window_manager.progress_update(self._done)
+        if context.area:
+            context.area.header_text_set(
+                f"Removing empty vertex groups: {self._done}/{self._total}  {current_name}  |  Esc: cancel"
+            )
+
+    def _finish(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._reading is not None:
+            self._reading[2].close()
+            self._reading = None
+        if context.area:
+            context.area.header_text_set(None)
 
 class OBJECT_OT_RemoveAllModifiers(bpy.types.Operator):
     """Remove All Modifiers"""
@@ -1240,13 +2193,44 @@ class OBJECT_OT_SelectMergeByDistance(bpy.types.Operator):
         step=0.01,
     )
 
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH' and obj.mode == 'EDIT'
+
+    use_numpy: bpy.props.BoolProperty(
+        name="Use NumPy",
+        description="Find close vertices with a NumPy spatial hash instead of one KD-tree query per vertex",
+        default=True,
+    )
+
+    def execute(self, context):
+        return selectMergeByDistanceVerts(self, context, self.threshold, self.use_numpy)
+
+class OBJECT_OT_AnalyzeMergeByDistance(bpy.types.Operator):
+    """Analyze merge by distance"""
+    bl_idname = "object.analyze_merge_by_distance"
+    bl_label = "Analyze merge by distance"
+    bl_description = "Reports the clusters that merge by distance would form and stores their IDs in the 'merge_cluster' vertex attribute"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    threshold: bpy.props.FloatProperty(
+        name="Threshold",
+        description="Maximum distance between vertices to consider for merging",
+        default=0.0001,
+        min=0.0,
+        max=1.0,
+        precision=6,
+        step=0.01,
+    )
+
     @classmethod
     def poll(cls, context):
         obj = context.active_object
         return obj is not None and obj.type == 'MESH' and obj.mode == 'EDIT'
 
     def execute(self, context):
-        return selectMergeByDistanceVerts(self, context, self.threshold)
+        return analyzeMergeByDistance(self, context, self.threshold)
 
 class OBJECT_OT_CleanUpMaterialsAndImages(bpy.types.Operator):
     """Clean Up Materials And Images"""
@@ -1329,6 +2313,7 @@ class OBJECT_PT_object_utilities(bpy.types.Panel):
 
         box = layout.box()
         box.operator("object.diff_object_data")
+        box.operator("object.diff_object_data_batch")
         box.operator("object.sync_object_properties")
         box.operator("object.copy_object_property_values")
         box.operator("object.copy_object_materials")
@@ -1337,6 +2322,7 @@ class OBJECT_PT_object_utilities(bpy.types.Panel):
 
         box.alert = True
         box.operator("object.remove_empty_vertex_groups")
+        box.operator("object.remove_empty_vertex_groups_batch")
         box.operator("object.remove_all_modifiers")
         box.operator("object.clean_and_apply_modifiers")
         box.operator("object.update_common_mesh")
@@ -1416,6 +2402,7 @@ class OBJECT_PT_object_edit_utilities(bpy.types.Panel):
         layout = self.layout
         box = layout.box()
         box.operator("object.select_merge_by_distance")
+        box.operator("object.analyze_merge_by_distance")
 
 class SCENE_PT_render_utilities(bpy.types.Panel):
     bl_idname = "SCENE_PT_render_utilities"
@@ -2009,6 +2996,7 @@ def register():
     bpy.utils.register_class(OBJECT_OT_HideAllParticles)
     bpy.utils.register_class(OBJECT_OT_ShowAllParticles)
     bpy.utils.register_class(OBJECT_OT_DiffObjectData)
+    bpy.utils.register_class(OBJECT_OT_DiffObjectDataBatch)
     bpy.utils.register_class(OBJECT_OT_SyncObjectProperties)
     bpy.utils.register_class(OBJECT_OT_CopyObjectPropertyValues)
     bpy.utils.register_class(OBJECT_OT_CopyObjectMaterials)
@@ -2016,6 +3004,7 @@ def register():
     bpy.utils.register_class(OBJECT_OT_CleanAndApplyModifiers)
     bpy.utils.register_class(OBJECT_OT_ToggleShadowCatcher)
     bpy.utils.register_class(OBJECT_OT_RemoveEmptyVertexGroups)
+    bpy.utils.register_class(OBJECT_OT_RemoveEmptyVertexGroupsBatch)
     bpy.utils.register_class(OBJECT_OT_RemoveAllModifiers)
     bpy.utils.register_class(OBJECT_OT_UpdateCommonMesh)
 
@@ -2029,6 +3018,7 @@ def register():
     bpy.utils.register_class(OBJECT_OT_RemoveScaleKeyframes)
 
     bpy.utils.register_class(OBJECT_OT_SelectMergeByDistance)
+    bpy.utils.register_class(OBJECT_OT_AnalyzeMergeByDistance)
     bpy.utils.register_class(OBJECT_OT_CleanUpMaterialsAndImages)
     bpy.utils.register_class(OBJECT_OT_ReplaceObjectInModifiers)
 #    bpy.utils.register_class(OBJECT_OT_RotateFaceVertexIndices)
@@ -2064,11 +3054,16 @@ def unregister():
     for km, kmi in addon_keymaps:
         km.keymap_items.remove(kmi)
     addon_keymaps.clear()
+    _rna_schema_cache.clear()
+    _modifier_schema_cache.clear()
+    _fcurve_index_cache.clear()
+    _merge_preview_cache.clear()
 
     bpy.utils.unregister_class(OBJECT_OT_PurgeAll)
     bpy.utils.unregister_class(OBJECT_OT_HideAllParticles)
     bpy.utils.unregister_class(OBJECT_OT_ShowAllParticles)
     bpy.utils.unregister_class(OBJECT_OT_DiffObjectData)
+    bpy.utils.unregister_class(OBJECT_OT_DiffObjectDataBatch)
     bpy.utils.unregister_class(OBJECT_OT_SyncObjectProperties)
     bpy.utils.unregister_class(OBJECT_OT_CopyObjectPropertyValues)
     bpy.utils.unregister_class(OBJECT_OT_CopyObjectMaterials)
@@ -2076,6 +3071,7 @@ def unregister():
     bpy.utils.unregister_class(OBJECT_OT_CleanAndApplyModifiers)
     bpy.utils.unregister_class(OBJECT_OT_ToggleShadowCatcher)
     bpy.utils.unregister_class(OBJECT_OT_RemoveEmptyVertexGroups)
+    bpy.utils.unregister_class(OBJECT_OT_RemoveEmptyVertexGroupsBatch)
     bpy.utils.unregister_class(OBJECT_OT_RemoveAllModifiers)
     bpy.utils.unregister_class(OBJECT_OT_UpdateCommonMesh)
 
@@ -2089,6 +3085,7 @@ def unregister():
     bpy.utils.unregister_class(OBJECT_OT_RemoveScaleKeyframes)
 
     bpy.utils.unregister_class(OBJECT_OT_SelectMergeByDistance)
+    bpy.utils.unregister_class(OBJECT_OT_AnalyzeMergeByDistance)
     bpy.utils.unregister_class(OBJECT_OT_CleanUpMaterialsAndImages)
     bpy.utils.unregister_class(OBJECT_OT_ReplaceObjectInModifiers)
 #    bpy.utils.unregister_class(OBJECT_OT_RotateFaceVertexIndices)